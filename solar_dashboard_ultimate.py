@@ -1,76 +1,23 @@
 
 import dash
-from dash import dcc, html, Input, Output, callback
+from dash import dcc, html, Input, Output, State, Patch, callback
 from dash.exceptions import PreventUpdate
 import plotly.graph_objects as go
+import plotly.io as pio
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from functools import lru_cache, wraps
 from dateutil.relativedelta import relativedelta
 import dash_bootstrap_components as dbc
 
-# Fix for orjson import issues - disable orjson to prevent serialization errors
-import os
-os.environ['DASH_SERIALIZER'] = 'json'
-
-# Helper function for applying filters
-def apply_filters(df, start_date, end_date, flare_classes, cycle_phases, magnetic_types, sunspot_range, flare_occurred):
-    """Apply all filters to the dataframe"""
-    filtered_df = df.copy()
-    
-    # Date filter
-    if start_date:
-        filtered_df = filtered_df[filtered_df['observation_date'] >= start_date]
-    if end_date:
-        filtered_df = filtered_df[filtered_df['observation_date'] <= end_date]
-    
-    # Flare class filter - convert to individual flare type filters
-    if flare_classes:
-        # Create a mask for any flare type that matches the selected classes
-        mask = pd.Series(False, index=filtered_df.index)
-        if 'X' in flare_classes:
-            mask |= (filtered_df['x_class_flares'] > 0)
-        if 'M' in flare_classes:
-            mask |= (filtered_df['m_class_flares'] > 0)
-        if 'C' in flare_classes:
-            mask |= (filtered_df['c_class_flares'] > 0)
-        filtered_df = filtered_df[mask]
-    
-    # Cycle phase filter - skip if column doesn't exist
-    if cycle_phases and 'cycle_phase' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['cycle_phase'].isin(cycle_phases)]
-    elif cycle_phases and 'solar_cycle_phase' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['solar_cycle_phase'].isin(cycle_phases)]
-    
-    # Magnetic complexity filter - skip if column doesn't exist
-    if magnetic_types and 'magnetic_complexity' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['magnetic_complexity'].isin(magnetic_types)]
-    
-    # Sunspot count filter - handle different column names
-    if sunspot_range:
-        if 'total_sunspots' in filtered_df.columns:
-            filtered_df = filtered_df[
-                (filtered_df['total_sunspots'] >= sunspot_range[0]) & 
-                (filtered_df['total_sunspots'] <= sunspot_range[1])
-            ]
-        elif 'sunspot_count' in filtered_df.columns:
-            filtered_df = filtered_df[
-                (filtered_df['sunspot_count'] >= sunspot_range[0]) & 
-                (filtered_df['sunspot_count'] <= sunspot_range[1])
-            ]
-    
-    # Flare occurred filter - calculate total_flares if needed
-    if flare_occurred:
-        # Calculate total_flares if it doesn't exist
-        if 'total_flares' not in filtered_df.columns:
-            filtered_df['total_flares'] = filtered_df['x_class_flares'] + filtered_df['m_class_flares'] + filtered_df['c_class_flares']
-        
-        if 'Yes' in flare_occurred and 'No' not in flare_occurred:
-            filtered_df = filtered_df[filtered_df['total_flares'] > 0]
-        elif 'No' in flare_occurred and 'Yes' not in flare_occurred:
-            filtered_df = filtered_df[filtered_df['total_flares'] == 0]
-    
-    return filtered_df
+# Serialize figures with orjson (C-level numpy/datetime encoding) when it imports cleanly,
+# otherwise stay on the stdlib json encoder
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pio.json.config.default_engine = 'json'
 
 # Load the datasets with error handling
 print("Loading data...")
@@ -116,14 +63,47 @@ solar_flare_df = solar_flare_df.astype({
     'm_class_flares': 'int16', 
     'c_class_flares': 'int16',
     'sunspot_count': 'int16',
-    'flare_occurred': 'int8'
+    'flare_index': 'float32',
+    'region_area': 'float32',
+    'solar_latitude': 'float32',
+    'solar_longitude': 'float32',
+    'flare_occurred': 'int8',
+    'magnetic_complexity': pd.CategoricalDtype(['Alpha', 'Beta', 'Gamma', 'Delta'], ordered=True)
+})
+sunspot_df = sunspot_df.astype({
+    'total_sunspots': 'int16',
+    'solar_flux': 'float32',
+    'avg_solar_wind_speed': 'float32',
+    'temperature_variation': 'float32',
+    'solar_cycle_phase': 'category'
 })
 
+def downcast_numeric(df):
+    """Downcast the remaining wide numeric columns to the smallest dtype that holds their values, in place"""
+    for column in df.select_dtypes(include='int64').columns:
+        df[column] = pd.to_numeric(df[column], downcast='integer')
+    for column in df.select_dtypes(include='float64').columns:
+        df[column] = pd.to_numeric(df[column], downcast='float')
+
+downcast_numeric(solar_flare_df)
+downcast_numeric(sunspot_df)
+
 print(f"Data loaded successfully: {len(solar_flare_df)} flare records, {len(sunspot_df)} sunspot records")
 
-# Filter data only until 2024
-solar_flare_df = solar_flare_df[solar_flare_df['observation_date'].dt.year <= 2024].copy()
-sunspot_df = sunspot_df[sunspot_df['date'].dt.year <= 2024].copy()
+# Filter data only until 2024; the sort below returns new frames, so no copy is needed here
+solar_flare_df = solar_flare_df[solar_flare_df['observation_date'].dt.year <= 2024]
+sunspot_df = sunspot_df[sunspot_df['date'].dt.year <= 2024]
+
+# Keep both frames in date order so a date range is a contiguous slice found by binary search
+solar_flare_df = solar_flare_df.sort_values('observation_date', kind='mergesort', ignore_index=True)
+sunspot_df = sunspot_df.sort_values('date', kind='mergesort', ignore_index=True)
+
+# Derived flare columns used by several charts, computed once instead of per callback
+solar_flare_df['total_flares'] = (
+    solar_flare_df['x_class_flares'] + solar_flare_df['m_class_flares'] + solar_flare_df['c_class_flares']
+).astype('int32')
+solar_flare_df['month'] = solar_flare_df['observation_date'].dt.month.astype('int8')
+solar_flare_df['year'] = solar_flare_df['observation_date'].dt.year.astype('int16')
 
 # Calculate month range for slider
 min_date = solar_flare_df['observation_date'].min()
@@ -132,6 +112,239 @@ min_date_for_slider = pd.to_datetime(min_date.strftime('%Y-%m-01'))
 max_date_for_slider = pd.to_datetime(max_date.strftime('%Y-%m-01'))
 total_months = (max_date_for_slider.year - min_date_for_slider.year) * 12 + max_date_for_slider.month - min_date_for_slider.month
 
+# Daily flare aggregates joined to sunspot data once, indexed by date for cheap range slicing
+combined_df = solar_flare_df.groupby('observation_date').agg({
+    'sunspot_count': 'mean',
+    'flare_index': 'mean',
+    'x_class_flares': 'sum',
+    'm_class_flares': 'sum',
+    'c_class_flares': 'sum'
+}).reset_index().merge(
+    sunspot_df[['date', 'total_sunspots', 'solar_flux', 'avg_solar_wind_speed']],
+    left_on='observation_date',
+    right_on='date',
+    how='inner'
+).set_index('observation_date').sort_index(kind='mergesort')
+
+# Monthly sunspot rollup shared by the monthly charts; the x values are one constant datetime64 array
+# Month-floor the dates in NumPy rather than via Period objects, so the group keys are already datetime64
+month_floor = sunspot_df['date'].values.astype('datetime64[M]').astype('datetime64[ns]')
+sunspot_monthly = sunspot_df.groupby(month_floor).agg({
+    'avg_solar_wind_speed': 'mean',
+    'total_sunspots': 'mean',
+    'solar_flux': 'mean',
+    'geomagnetic_index': 'mean',
+    'temperature_variation': 'mean'
+}).rename_axis('date').reset_index()
+_MONTHLY_TS = sunspot_monthly['date'].values
+
+def date_bounds(dates, start_date, end_date):
+    """Return the [lo, hi) positions of the sorted datetime64 array covering start_date..end_date inclusive"""
+    return np.searchsorted(dates, start_date, side='left'), np.searchsorted(dates, end_date, side='right')
+
+def monthly_bounds(start_date, end_date):
+    """Return the [lo, hi) positions of sunspot_monthly covering start_date..end_date inclusive"""
+    return date_bounds(_MONTHLY_TS, pd.Timestamp(start_date).to_datetime64(), pd.Timestamp(end_date).to_datetime64())
+
+@lru_cache(maxsize=16)
+def get_monthly_agg(start_date, end_date):
+    """Monthly sunspot means between the two dates, shared by the monthly sunspot charts (treat as read-only).
+    Sunspot rows are dated on the 1st, so a date range keeps whole months and this is a slice of sunspot_monthly"""
+    lo, hi = monthly_bounds(start_date, end_date)
+    return sunspot_monthly.iloc[lo:hi]
+
+_SUN_DATES = sunspot_df['date'].values
+_SUN_TOTALS = sunspot_df['total_sunspots'].values
+
+# Raw column arrays for the flare filters, extracted once so callbacks skip pandas dispatch
+_FLARE_DATES = solar_flare_df['observation_date'].values
+_FLARE_MONTH = _FLARE_DATES.astype('datetime64[M]')
+_FLARE_SUNSPOTS = solar_flare_df['sunspot_count'].values
+_FLARE_OCCURRED = solar_flare_df['flare_occurred'].values
+_FLARE_XMC = solar_flare_df[['x_class_flares', 'm_class_flares', 'c_class_flares']].to_numpy()
+_FLARE_TOTAL = solar_flare_df['total_flares'].values
+_FLARE_INDEX = solar_flare_df['flare_index'].values
+_FLARE_MAGNETIC = solar_flare_df['magnetic_complexity'].to_numpy()
+_FLARE_REGION_CODE = pd.factorize(solar_flare_df['region_id'])[0].astype('int32')
+
+# Radar chart axes as one float64 block, normalised by the unfiltered column maxima so the scale is
+# stable across filters
+_RADAR_COLUMNS = ['sunspot_count', 'x_class_flares', 'm_class_flares', 'c_class_flares', 'flare_index']
+_RADAR_VALUES = solar_flare_df[_RADAR_COLUMNS].to_numpy(dtype='float64')
+_GLOBAL_MAX = _RADAR_VALUES.max(axis=0)
+
+# Region map hover values formatted once at load; shorter on the wire than float32 values widened to float64
+_REGION_AREA_STR = solar_flare_df['region_area'].map('{:.0f}'.format).values
+_FLARE_INDEX_STR = solar_flare_df['flare_index'].map('{:.2f}'.format).values
+
+# Magnetic classes as int8 codes so the filter is a table lookup instead of a string isin;
+# the codes come straight from the categorical and unknown labels get the extra, never-allowed slot
+_MAG_MAP = {name: code for code, name in enumerate(solar_flare_df['magnetic_complexity'].cat.categories)}
+_FLARE_MAG_CODE = solar_flare_df['magnetic_complexity'].cat.codes.values.astype('int8')
+_FLARE_MAG_CODE[_FLARE_MAG_CODE < 0] = len(_MAG_MAP)
+_MAG_NAMES = np.array(list(_MAG_MAP))
+
+# Solar cycle phases as codes into the sorted phase names, for bincount-based counting
+_SUNSPOT_CYCLE_CODE = sunspot_df['solar_cycle_phase'].cat.codes.values
+_CYCLE_NAMES = np.asarray(sunspot_df['solar_cycle_phase'].cat.categories)
+
+def most_frequent_first(counts):
+    """Positions of counts from largest to smallest. Ties are left in whatever order numpy's default
+    (unstable) argsort gives, the same sort value_counts uses, not necessarily category order"""
+    return np.argsort(-counts)
+
+def category_counts(codes, names):
+    """Count codes into names, ordered by most_frequent_first, dropping empty categories"""
+    counts = np.bincount(codes, minlength=len(names))[:len(names)]
+    order = most_frequent_first(counts)
+    order = order[counts[order] > 0]
+    return names[order], counts[order]
+
+def bin_index(values, edges, include_lowest=False):
+    """Right-closed bin of each value like pd.cut, as positions into the edges; -1 when outside the edges or NaN"""
+    values = np.asarray(values, dtype=float)
+    idx = np.searchsorted(edges, values, side='left') - 1
+    if include_lowest:
+        idx[values == edges[0]] = 0
+    idx[idx >= len(edges) - 1] = -1
+    return idx
+
+def bin_counts(values, edges, include_lowest=False):
+    """Count values per right-closed bin in edge order, including empty bins"""
+    idx = bin_index(values, edges, include_lowest)
+    return np.bincount(idx[idx >= 0], minlength=len(edges) - 1)
+
+def yearly_mean(dates, values):
+    """Mean of values per calendar year of dates, skipping NaN like groupby('year').mean(); returns (years, means)"""
+    values = np.asarray(values, dtype=float)
+    years, year_idx = np.unique(np.asarray(dates, dtype='datetime64[Y]').astype(np.int64) + 1970, return_inverse=True)
+    valid = ~np.isnan(values)
+    sums = np.bincount(year_idx[valid], weights=values[valid], minlength=len(years))
+    counts = np.bincount(year_idx[valid], minlength=len(years))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return years, sums / counts
+
+# Most normal points drawn on the anomaly scatter; anomalies are always drawn in full
+_MAX_NORMAL_POINTS = 2000
+
+def downsample_positions(n, limit):
+    """Evenly strided positions keeping at most limit of n points, always including the first and last"""
+    if n <= limit:
+        return np.arange(n)
+    return np.linspace(0, n - 1, limit).astype(np.intp)
+
+def group_arrays(codes, values):
+    """Split values into a dict of arrays keyed by code with one stable sort, keeping row order within each group"""
+    codes = np.asarray(codes)
+    order = np.argsort(codes, kind='stable')
+    keys, starts = np.unique(codes[order], return_index=True)
+    return dict(zip(keys.tolist(), np.split(np.asarray(values)[order], starts[1:])))
+
+# Filter fallbacks for unset widgets, computed once instead of per callback
+_DATE_MIN = min_date.to_datetime64()
+_DATE_MAX = max_date.to_datetime64()
+_SUN_MIN = float(solar_flare_df['sunspot_count'].min())
+_SUN_MAX = float(solar_flare_df['sunspot_count'].max())
+
+# Every filterable flare attribute folded into one int32 code per row: magnetic code, flare flag and
+# sunspot count offset. A filter then becomes a single gather from a small allowed-combinations table
+_SUN_VALUES = np.arange(int(_SUN_MIN), int(_SUN_MAX) + 1)
+_FLARE_FILTER_CODE = (
+    (_FLARE_MAG_CODE.astype('int32') * 2 + _FLARE_OCCURRED) * len(_SUN_VALUES) + (_FLARE_SUNSPOTS - int(_SUN_MIN))
+).astype('int32')
+
+def normalize_filters(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
+    """Fill in defaults for unset filter widgets and parse the ISO dates sent by the date pickers"""
+    start_date = _DATE_MIN if start_date is None else np.datetime64(start_date[:10])
+    end_date = _DATE_MAX if end_date is None else np.datetime64(end_date[:10])
+    if not flare_classes:
+        flare_classes = ['X', 'M', 'C']
+    if not magnetic_types:
+        magnetic_types = ['Alpha', 'Beta', 'Gamma', 'Delta']
+    if sunspot_range is None or len(sunspot_range) < 2:
+        sunspot_range = [_SUN_MIN, _SUN_MAX]
+    if not flare_occurred:
+        flare_occurred = [0, 1]
+    return start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred
+
+# Column of each flare class in _FLARE_XMC
+_FLARE_CLASS_COLUMN = {'X': 0, 'M': 1, 'C': 2}
+
+@lru_cache(maxsize=32)
+def filtered_indices(start_date, end_date, class_key, magnetic_key, sunspot_low, sunspot_high, occurred_key):
+    """Row positions into solar_flare_df passing all filters, shared by every chart callback.
+    
+    An empty class_key leaves flare classes unfiltered; otherwise a row needs a flare of one of the given classes.
+    """
+    lo, hi = date_bounds(_FLARE_DATES, start_date, end_date)
+    mag_allowed = np.zeros(len(_MAG_MAP) + 1, dtype=bool)
+    mag_allowed[[_MAG_MAP[m] for m in magnetic_key if m in _MAG_MAP]] = True
+    occurred_allowed = np.zeros(2, dtype=bool)
+    occurred_allowed[[int(o) for o in occurred_key]] = True
+    sun_allowed = (_SUN_VALUES >= sunspot_low) & (_SUN_VALUES <= sunspot_high)
+    # Same layout as _FLARE_FILTER_CODE, so one gather applies all three filters in a single pass
+    allowed = (mag_allowed[:, None, None] & occurred_allowed[None, :, None] & sun_allowed[None, None, :]).ravel()
+    mask = allowed[_FLARE_FILTER_CODE[lo:hi]]
+    if class_key:
+        columns = [_FLARE_CLASS_COLUMN[c] for c in class_key if c in _FLARE_CLASS_COLUMN]
+        mask &= (_FLARE_XMC[lo:hi, columns] > 0).any(axis=1)
+    return np.flatnonzero(mask) + lo
+
+def filter_key(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
+    """Hashable, order-insensitive arguments for filtered_indices"""
+    return (start_date, end_date, tuple(sorted(flare_classes)), tuple(sorted(magnetic_types)),
+            sunspot_range[0], sunspot_range[1], tuple(sorted(flare_occurred)))
+
+def filter_and_sum(start_date, end_date, magnetic_types, sunspot_range, flare_occurred):
+    """Sum X, M and C flare counts over the rows passing all but the flare class filter"""
+    return _FLARE_XMC[filtered_indices(*filter_key(start_date, end_date, (), magnetic_types, sunspot_range, flare_occurred))].sum(axis=0)
+
+def flare_store_key(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
+    """JSON-safe filter_key for charts drawn from filtered_indices; flare classes do not affect them"""
+    start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred = normalize_filters(
+        start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred)
+    start, end, _, mags, low, high, occurred = filter_key(start_date, end_date, (), magnetic_types, sunspot_range, flare_occurred)
+    return [str(start), str(end), list(mags), low, high, list(occurred)]
+
+def sunspot_store_key(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
+    """JSON-safe key for charts filtered only by date and sunspot range"""
+    start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred = normalize_filters(
+        start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred)
+    return [str(start_date), str(end_date), sunspot_range[0], sunspot_range[1]]
+
+def figure_traces(fig):
+    """Trace list of a go.Figure or a figure dict"""
+    return fig['data'] if isinstance(fig, dict) else fig.to_plotly_json()['data']
+
+def skip_unchanged(key_func, patch_data=False):
+    """Skip a callback whose inputs map to the key held in its trailing State, otherwise append the new state to its outputs.
+    
+    With patch_data, a single-figure callback whose layout is constant sends a Patch of its traces whenever the
+    previous render also drew traces.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args):
+            *inputs, last = args
+            last = last or {}
+            try:
+                key = key_func(*inputs)
+            except Exception as e:
+                app.logger.warning("ERROR in %s (filter key): %s", func.__name__, e)
+                raise PreventUpdate
+            if key == last.get('key'):
+                raise PreventUpdate
+            result = func(*inputs)
+            if isinstance(result, tuple):
+                return (*result, {'key': key})
+            traces = figure_traces(result)
+            if patch_data and traces and last.get('drawn'):
+                result = Patch()
+                result['data'] = traces
+            return result, {'key': key, 'drawn': len(traces) > 0}
+        return wrapper
+    return decorator
+
 # Initialize the Dash app with Bootstrap theme
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "🌞 Solar Activity Dashboard - Interactive"
@@ -143,6 +356,9 @@ interval_component = dcc.Interval(
     n_intervals=0
 )
 
+# Last filter key each chart was drawn for, so inputs that do not affect a chart skip its recompute
+filter_key_stores = [dcc.Store(id=f'{name}-key') for name in ['metrics', 'magnetic-donut-chart', 'sunspot-charts']]
+
 # Beautiful Orange Theme Colors
 colors = {
     'primary': '#FF6B35',
@@ -2382,6 +2598,7 @@ app.index_string = '''
 app.layout = html.Div([
     # Auto-refresh interval component
     interval_component,
+    *filter_key_stores,
     # Toggle Button
     html.Button(
         html.I(className="fas fa-bars"),
@@ -2892,8 +3109,8 @@ def update_dates_from_year_month(from_year, to_year, start_month, end_month):
         end_date = pd.Timestamp(f'{to_year}-{end_month+1:02d}-01') - pd.Timedelta(days=1)
     
     # Clamp to actual data range
-    start_date = max(start_date, solar_flare_df['observation_date'].min())
-    end_date = min(end_date, solar_flare_df['observation_date'].max())
+    start_date = max(start_date, min_date)
+    end_date = min(end_date, max_date)
     
     # Convert to string format for DatePickerSingle
     return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
@@ -2956,6 +3173,97 @@ def update_filter_summary(start_date, end_date, flare_classes, cycle_phases, mag
 # Original metrics callback removed to prevent conflicts with enhanced version
 
 
+# Placeholder figures returned by reference when a chart has nothing to draw or fails
+_EMPTY_FIG = go.Figure().add_annotation(text="No data available for selected filters", 
+                                        xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+_ERROR_FIG = go.Figure().add_annotation(text="Error loading data", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+
+# Shared figure styling, built once at import instead of on every callback
+_LAYOUT_BASE = dict(
+    template='none',
+    plot_bgcolor='rgba(255, 255, 255, 0.1)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(family='Inter', color='#2C3E50')
+)
+
+_AXIS_STYLE = dict(
+    color='#2C3E50', 
+    gridcolor='rgba(255, 107, 53, 0.15)', 
+    showgrid=True,
+    linecolor='rgba(255, 107, 53, 0.3)',
+    tickfont=dict(size=12, color='#2C3E50', family='Inter')
+)
+
+_HOVERLABEL = dict(
+    bgcolor='rgba(255, 255, 255, 0.95)', 
+    bordercolor='#FF6B35', 
+    font=dict(size=12, color='#2C3E50', family='Inter')
+)
+
+_LAYOUT_TIMELINE = dict(
+    **_LAYOUT_BASE,
+    xaxis=dict(
+        title=dict(text="Date", font=dict(size=16, color='#2C3E50', family='Inter')),
+        color='#2C3E50', 
+        gridcolor='rgba(255, 107, 53, 0.15)', 
+        showgrid=True,
+        linecolor='rgba(255, 107, 53, 0.3)',
+        tickfont=dict(size=14, color='#2C3E50', family='Inter')
+    ),
+    yaxis=dict(
+        title=dict(text="Total Sunspots", font=dict(size=18, color='#FF8C00', family='Inter')),
+        side="left", 
+        color='#FF8C00', 
+        gridcolor='rgba(255, 140, 0, 0.3)', 
+        showgrid=True,
+        linecolor='rgba(255, 140, 0, 0.8)',
+        linewidth=3,
+        tickfont=dict(size=15, color='#FF8C00', family='Inter')
+    ),
+    yaxis2=dict(
+        title=dict(text="Solar Flux (SFU)", font=dict(size=18, color='#FFD700', family='Inter')),
+        side="right", 
+        overlaying="y", 
+        color='#FFD700',
+        gridcolor='rgba(255, 215, 0, 0.3)',
+        linecolor='rgba(255, 215, 0, 0.8)',
+        linewidth=3,
+        tickfont=dict(size=15, color='#FFD700', family='Inter')
+    ),
+    hovermode='x unified',
+    height=600,  # Increased height for larger chart
+    legend=dict(
+        orientation="h", 
+        yanchor="bottom", 
+        y=1.02, 
+        xanchor="center", 
+        x=0.5,
+        bgcolor='rgba(255, 255, 255, 0.95)',
+        bordercolor='rgba(255, 107, 53, 0.5)',
+        borderwidth=3,
+        font=dict(size=16, color='#2C3E50', family='Inter'),
+        itemsizing='constant',
+        itemwidth=40
+    ),
+    margin=dict(t=120, b=100, l=100, r=100),  # Increased margins for larger chart
+    hoverlabel=dict(_HOVERLABEL, font=dict(size=14, color='#2C3E50', family='Inter'))
+)
+
+def count_bar_layout(title, x_title):
+    """Layout shared by the phase and magnetic complexity count bars"""
+    return dict(
+        **_LAYOUT_BASE,
+        title=dict(text=title, font=dict(size=22, color='#2C3E50', family='Inter')),
+        xaxis=dict(title=dict(text=x_title, font=dict(size=14, color='#2C3E50', family='Inter')), **_AXIS_STYLE),
+        yaxis=dict(title=dict(text="Count", font=dict(size=14, color='#2C3E50', family='Inter')), **_AXIS_STYLE),
+        height=450,
+        margin=dict(t=80, b=80, l=80, r=80),
+        hoverlabel=_HOVERLABEL
+    )
+
+_LAYOUT_CYCLE_PHASE = count_bar_layout("Solar Cycle Phase Distribution", "Phase")
+_LAYOUT_MAGNETIC_COMPLEXITY = count_bar_layout("Magnetic Complexity Distribution", "Complexity Type")
+
 # Callback for sunspot timeline
 @app.callback(
     Output('sunspot-timeline', 'figure'),
@@ -2979,15 +3287,17 @@ def update_sunspot_timeline(start_date, end_date, cycle_phases):
         if cycle_phases is None or len(cycle_phases) == 0:
             cycle_phases = ['Rising', 'Peak', 'Declining', 'Minimum']
     except Exception as e:
-        print(f"ERROR in update_sunspot_timeline (date handling): {str(e)}")
+        app.logger.warning("ERROR in update_sunspot_timeline (date handling): %s", e)
         raise PreventUpdate
     
     try:
-        sunspot_filtered = sunspot_df[
-            (sunspot_df['date'] >= start_date) & 
-            (sunspot_df['date'] <= end_date) &
-            (sunspot_df['solar_cycle_phase'].isin(cycle_phases))
-        ].copy()
+        # Select only the columns the timeline reads
+        sun_lo, sun_hi = date_bounds(_SUN_DATES, start_date.to_datetime64(), end_date.to_datetime64())
+        sunspot_filtered = sunspot_df.iloc[sun_lo:sun_hi]
+        sunspot_filtered = sunspot_filtered.loc[
+            sunspot_filtered['solar_cycle_phase'].isin(cycle_phases),
+            ['date', 'total_sunspots', 'solar_flux']
+        ]
         
         if len(sunspot_filtered) == 0:
             return go.Figure().add_annotation(text="No data available for selected filters", 
@@ -3045,224 +3355,203 @@ def update_sunspot_timeline(start_date, end_date, cycle_phases):
             showlegend=True
         ))
         
-        fig.update_layout(
-            xaxis=dict(
-                title=dict(text="Date", font=dict(size=16, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)', 
-                showgrid=True,
-                linecolor='rgba(255, 107, 53, 0.3)',
-                tickfont=dict(size=14, color='#2C3E50', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Total Sunspots", font=dict(size=18, color='#FF8C00', family='Inter')),
-                side="left", 
-                color='#FF8C00', 
-                gridcolor='rgba(255, 140, 0, 0.3)', 
-                showgrid=True,
-                linecolor='rgba(255, 140, 0, 0.8)',
-                linewidth=3,
-                tickfont=dict(size=15, color='#FF8C00', family='Inter')
-            ),
-            yaxis2=dict(
-                title=dict(text="Solar Flux (SFU)", font=dict(size=18, color='#FFD700', family='Inter')),
-                side="right", 
-                overlaying="y", 
-                color='#FFD700',
-                gridcolor='rgba(255, 215, 0, 0.3)',
-                linecolor='rgba(255, 215, 0, 0.8)',
-                linewidth=3,
-                tickfont=dict(size=15, color='#FFD700', family='Inter')
-            ),
-            hovermode='x unified',
-            template='none',
-            height=600,  # Increased height for larger chart
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            legend=dict(
-                orientation="h", 
-                yanchor="bottom", 
-                y=1.02, 
-                xanchor="center", 
-                x=0.5,
-                bgcolor='rgba(255, 255, 255, 0.95)',
-                bordercolor='rgba(255, 107, 53, 0.5)',
-                borderwidth=3,
-                font=dict(size=16, color='#2C3E50', family='Inter'),
-                itemsizing='constant',
-                itemwidth=40
-            ),
-            margin=dict(t=120, b=100, l=100, r=100),  # Increased margins for larger chart
-            hoverlabel=dict(
-                bgcolor='rgba(255, 255, 255, 0.95)', 
-                bordercolor='#FF6B35', 
-                font=dict(size=14, color='#2C3E50', family='Inter')
-            ),
-        )
+        fig.update_layout(_LAYOUT_TIMELINE)
         
         return fig
     except Exception as e:
-        print(f"ERROR in update_sunspot_timeline: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_sunspot_timeline: %s", e)
+        return _ERROR_FIG
 
-# Callback for Solar Wind Speed Analysis
-@app.callback(
-    Output('solar-wind-speed-chart', 'figure'),
-    [Input('start-date-picker', 'date'),
-     Input('end-date-picker', 'date'),
-     Input('flare-class-filter', 'value'),
-     Input('cycle-phase-filter', 'value'),
-     Input('magnetic-complexity-filter', 'value'),
-     Input('sunspot-count-slider', 'value'),
-     Input('flare-occurred-filter', 'value')]
-)
-def update_solar_wind_speed_chart(start_date, end_date, flare_classes, cycle_phases, magnetic_types, sunspot_range, flare_occurred):
-    try:
-        # Apply filters to sunspot data
-        sunspot_filtered = sunspot_df[
-            (sunspot_df['date'] >= start_date) & 
-            (sunspot_df['date'] <= end_date)
-        ].copy()
-        
-        if len(sunspot_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        
-        # Create solar wind speed data
-        wind_data = sunspot_filtered.groupby(sunspot_filtered['date'].dt.to_period('M')).agg({
-            'avg_solar_wind_speed': 'mean',
-            'total_sunspots': 'mean'
-        }).reset_index()
-        
-        wind_data['date'] = wind_data['date'].dt.to_timestamp()
-        
-        # Beautiful Orange Theme for Solar Wind Speed - Area Chart
-        fig = go.Figure(data=[go.Scatter(
-            x=wind_data['date'],
-            y=wind_data['avg_solar_wind_speed'],
-                mode='lines+markers',
-            name='Solar Wind Speed',
-            line=dict(color='#FF6B35', width=4, shape='spline'),
-            marker=dict(size=8, color='#FF8C42', line=dict(width=2, color='white')),
-                fill='tozeroy',
-            fillcolor='rgba(255, 107, 53, 0.3)',
-            hovertemplate='<b>Date:</b> %{x}<br><b>Wind Speed:</b> %{y} km/s<extra></extra>'
-        )])
-        
-        fig.update_layout(
-            xaxis=dict(
-                title=dict(text="Date", font=dict(size=14, color='#FF6B35', family='Inter')),
+@lru_cache(maxsize=16)
+def solar_wind_speed_figure(start_date, end_date):
+    """Build the monthly solar wind speed area chart, memoized on the date range"""
+    # Slice the precomputed monthly rollup to the selected date range
+    lo, hi = monthly_bounds(start_date, end_date)
+    
+    if hi == lo:
+        return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False).to_dict()
+    
+    # Beautiful Orange Theme for Solar Wind Speed - Area Chart
+    fig = go.Figure(data=[go.Scatter(
+        x=_MONTHLY_TS[lo:hi],
+        y=sunspot_monthly['avg_solar_wind_speed'].values[lo:hi],
+            mode='lines+markers',
+        name='Solar Wind Speed',
+        line=dict(color='#FF6B35', width=4, shape='spline'),
+        marker=dict(size=8, color='#FF8C42', line=dict(width=2, color='white')),
+            fill='tozeroy',
+        fillcolor='rgba(255, 107, 53, 0.3)',
+        hovertemplate='<b>Date:</b> %{x}<br><b>Wind Speed:</b> %{y} km/s<extra></extra>'
+    )])
+    
+    fig.update_layout(
+        xaxis=dict(
+            title=dict(text="Date", font=dict(size=14, color='#FF6B35', family='Inter')),
+            color='#FF6B35',
+            gridcolor='rgba(255, 107, 53, 0.2)',
+            tickfont=dict(size=12, color='#FF6B35', family='Inter')
+        ),
+        yaxis=dict(
+            title=dict(text="Wind Speed (km/s)", font=dict(size=14, color='#FF6B35', family='Inter')),
+            color='#FF6B35',
+            gridcolor='rgba(255, 107, 53, 0.2)',
+            tickfont=dict(size=12, color='#FF6B35', family='Inter')
+        ),
+        template='none',
+        height=400,
+        plot_bgcolor='rgba(255, 255, 255, 0.1)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter', color='#2C3E50'),
+        margin=dict(t=80, b=60, l=60, r=60)
+    )
+    
+    return fig.to_dict()
+
+@lru_cache(maxsize=16)
+def solar_irradiance_figure(start_date, end_date):
+    """Build the solar flux level polar chart, memoized on the date range"""
+    # Monthly solar irradiance data from the shared sunspot rollup
+    irradiance_data = get_monthly_agg(start_date, end_date)
+    
+    if len(irradiance_data) == 0:
+        return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False).to_dict()
+    
+    # Beautiful Orange Theme for Solar Flux Levels - Polar Chart
+    # Create flux level categories
+    flux_counts = bin_counts(irradiance_data['solar_flux'], [0, 80, 120, 160, 200, np.inf])
+    
+    # Create polar chart data
+    categories = ['Very Low', 'Low', 'Medium', 'High', 'Very High']
+    values = flux_counts.tolist()
+    
+    # Beautiful Orange Theme for Flux Levels - Polar Chart
+    fig = go.Figure(data=[go.Scatterpolar(
+        r=values,
+        theta=categories,
+        fill='toself',
+        name='Solar Flux Levels',
+        line_color='#FF6B35',
+        fillcolor='rgba(255, 107, 53, 0.3)',
+        marker=dict(
+            size=8,
+            color='#FF6B35',
+            line=dict(color='white', width=2)
+        ),
+        hovertemplate='<b>%{theta}</b><br>Count: %{r}<br><extra></extra>'
+    )])
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, max(values) if max(values) > 0 else 1],
                 color='#FF6B35',
-                gridcolor='rgba(255, 107, 53, 0.2)',
+                gridcolor='rgba(255, 107, 53, 0.3)',
                 tickfont=dict(size=12, color='#FF6B35', family='Inter')
             ),
-            yaxis=dict(
-                title=dict(text="Wind Speed (km/s)", font=dict(size=14, color='#FF6B35', family='Inter')),
+            angularaxis=dict(
                 color='#FF6B35',
-                gridcolor='rgba(255, 107, 53, 0.2)',
                 tickfont=dict(size=12, color='#FF6B35', family='Inter')
-            ),
-            template='none',
-            height=400,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=60, l=60, r=60)
-        )
-        
-        return fig
-    except Exception as e:
-        print(f"ERROR in update_solar_wind_speed_chart: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+            )
+        ),
+        template='none',
+        height=400,
+        plot_bgcolor='rgba(255, 255, 255, 0.1)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter', color='#2C3E50'),
+        margin=dict(t=60, b=60, l=60, r=60)
+    )
+    
+    return fig.to_dict()
 
-# Callback for Solar Irradiance Distribution
-@app.callback(
-    Output('solar-irradiance-chart', 'figure'),
-    [Input('start-date-picker', 'date'),
-     Input('end-date-picker', 'date'),
-     Input('flare-class-filter', 'value'),
-     Input('cycle-phase-filter', 'value'),
-     Input('magnetic-complexity-filter', 'value'),
-     Input('sunspot-count-slider', 'value'),
-     Input('flare-occurred-filter', 'value')]
-)
-def update_solar_irradiance_chart(start_date, end_date, flare_classes, cycle_phases, magnetic_types, sunspot_range, flare_occurred):
-    try:
-        # Apply filters to sunspot data
-        sunspot_filtered = sunspot_df[
-            (sunspot_df['date'] >= start_date) & 
-            (sunspot_df['date'] <= end_date)
-        ].copy()
-        
-        if len(sunspot_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        
-        # Create solar irradiance scatter plot data
-        irradiance_data = sunspot_filtered.groupby(sunspot_filtered['date'].dt.to_period('M')).agg({
-            'solar_flux': 'mean',
-            'total_sunspots': 'mean',
-            'geomagnetic_index': 'mean'
-        }).reset_index()
-        
-        irradiance_data['date'] = irradiance_data['date'].dt.to_timestamp()
-        
-        # Beautiful Orange Theme for Solar Flux Levels - Polar Chart
-        # Create flux level categories
-        irradiance_data['flux_level'] = pd.cut(
-            irradiance_data['solar_flux'], 
-            bins=[0, 80, 120, 160, 200, float('inf')], 
-            labels=['Very Low', 'Low', 'Medium', 'High', 'Very High']
-        )
-        
-        # Count flux levels
-        flux_counts = irradiance_data['flux_level'].value_counts()
-        
-        # Create polar chart data
-        categories = ['Very Low', 'Low', 'Medium', 'High', 'Very High']
-        values = [flux_counts.get(cat, 0) for cat in categories]
-        
-        # Beautiful Orange Theme for Flux Levels - Polar Chart
-        fig = go.Figure(data=[go.Scatterpolar(
-            r=values,
-            theta=categories,
-            fill='toself',
-            name='Solar Flux Levels',
-            line_color='#FF6B35',
-            fillcolor='rgba(255, 107, 53, 0.3)',
-            marker=dict(
-                size=8,
-                color='#FF6B35',
-                line=dict(color='white', width=2)
-            ),
-            hovertemplate='<b>%{theta}</b><br>Count: %{r}<br><extra></extra>'
-        )])
-        
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, max(values) if max(values) > 0 else 1],
-                    color='#FF6B35',
-                    gridcolor='rgba(255, 107, 53, 0.3)',
-                    tickfont=dict(size=12, color='#FF6B35', family='Inter')
-                ),
-                angularaxis=dict(
-                    color='#FF6B35',
-                    tickfont=dict(size=12, color='#FF6B35', family='Inter')
-                )
-            ),
-            template='none',
-            height=400,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=60, b=60, l=60, r=60)
-        )
-        
-        return fig
-    except Exception as e:
-        print(f"ERROR in update_solar_irradiance_chart: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+@lru_cache(maxsize=16)
+def flare_class_distribution_figure(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
+    """Build the flare class donut for one filter combination, memoized on the hashable filter tuple"""
+    # Filter and total all three flare classes in one pass
+    x_count, m_count, c_count = filter_and_sum(start_date, end_date, magnetic_types, sunspot_range, flare_occurred)
+    
+    # Calculate dynamic flare totals based on selected classes
+    flare_totals = {}
+    if 'X' in flare_classes and x_count > 0:
+        flare_totals['X-Class'] = x_count
+    if 'M' in flare_classes and m_count > 0:
+        flare_totals['M-Class'] = m_count
+    if 'C' in flare_classes and c_count > 0:
+        flare_totals['C-Class'] = c_count
+    
+    if not flare_totals:
+        flare_totals = {'No Data': 0}
+    
+    # Sunrise Orange Theme for Flare Distribution
+    color_map = {
+        'X-Class': '#FF4500',  # Orange Red
+        'M-Class': '#FF8C00',  # Dark Orange
+        'C-Class': '#FFA500',  # Orange
+        'B-Class': '#FFB347',  # Peach
+        'A-Class': '#FFD700'   # Gold
+    }
+    colors_list = [color_map.get(label, '#FFB366') for label in flare_totals.keys()]
+    
+    # Create a more prominent donut chart with better visibility
+    fig = go.Figure(data=[go.Pie(
+        labels=list(flare_totals.keys()),
+        values=list(flare_totals.values()),
+        hole=0.4,  # Smaller hole for more visible data
+        marker_colors=colors_list,
+        textinfo='label+value+percent',
+        textfont_size=16,
+        textfont_color='white',
+        textfont_family='Inter',
+        hovertemplate='<b>%{label}</b><br>Flare Count: %{value:,}<br>Percentage: %{percent}<br><extra></extra>',
+        marker_line=dict(color='white', width=3),
+        rotation=0,  # Start from top
+        pull=[0.15, 0.1, 0.05],  # More prominent pull for visual appeal
+        textposition='inside',
+        insidetextorientation='radial'
+    )])
+    
+    # Add center annotation showing total flares
+    total_flares = sum(flare_totals.values())
+    
+    fig.update_layout(
+        template='none',
+        height=450,
+        plot_bgcolor='rgba(255, 255, 255, 0.1)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter', color='#2C3E50'),
+        showlegend=True,
+        legend=dict(
+            orientation="v", 
+            yanchor="middle", 
+            y=0.5, 
+            xanchor="left", 
+            x=1.02,
+            bgcolor='rgba(255, 255, 255, 0.9)',
+            bordercolor='rgba(255, 107, 53, 0.5)',
+            borderwidth=2,
+            font=dict(size=14, color='#2C3E50', family='Inter')
+        ),
+        margin=dict(t=80, b=60, l=60, r=120),
+        hoverlabel=dict(
+            bgcolor='rgba(255, 255, 255, 0.95)', 
+            bordercolor='#FF6B35', 
+            font=dict(size=12, color='#2C3E50', family='Inter')
+        ),
+        annotations=[
+            dict(
+                text=f"<b>Total Flares</b><br>{total_flares:,}",
+                x=0.5, y=0.5,
+                font_size=16,
+                font_color='#2C3E50',
+                font_family='Inter',
+                showarrow=False,
+                xref='paper',
+                yref='paper'
+            )
+        ]
+    )
+    
+    return fig.to_dict()
 
 # Callback for flare class distribution
 @app.callback(
@@ -3276,138 +3565,16 @@ def update_solar_irradiance_chart(start_date, end_date, flare_classes, cycle_pha
 )
 def update_flare_class_distribution(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
     try:
-        # Handle None dates
-        if start_date is None:
-            start_date = solar_flare_df['observation_date'].min()
-        if end_date is None:
-            end_date = solar_flare_df['observation_date'].max()
-        
-        # Convert to datetime if strings
-        start_date = pd.to_datetime(start_date)
-        end_date = pd.to_datetime(end_date)
-        
-        # Handle None filters
-        if flare_classes is None or len(flare_classes) == 0:
-            flare_classes = ['X', 'M', 'C']
-        if magnetic_types is None or len(magnetic_types) == 0:
-            magnetic_types = ['Alpha', 'Beta', 'Gamma', 'Delta']
-        if sunspot_range is None or len(sunspot_range) < 2:
-            sunspot_range = [float(solar_flare_df['sunspot_count'].min()), float(solar_flare_df['sunspot_count'].max())]
-        if flare_occurred is None or len(flare_occurred) == 0:
-            flare_occurred = [0, 1]
+        start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred = normalize_filters(
+            start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred)
     except Exception as e:
         raise PreventUpdate
     
     try:
-        # Apply comprehensive filtering for dynamic data
-        flare_filtered = solar_flare_df[
-            (solar_flare_df['observation_date'] >= start_date) & 
-            (solar_flare_df['observation_date'] <= end_date)
-        ].copy()
-        
-        # Apply magnetic complexity filter if column exists
-        if 'magnetic_complexity' in flare_filtered.columns:
-            flare_filtered = flare_filtered[flare_filtered['magnetic_complexity'].isin(magnetic_types)]
-        
-        # Apply sunspot count filter
-        flare_filtered = flare_filtered[
-            (flare_filtered['sunspot_count'] >= sunspot_range[0]) &
-            (flare_filtered['sunspot_count'] <= sunspot_range[1])
-        ]
-        
-        # Apply flare occurred filter
-        flare_filtered = flare_filtered[flare_filtered['flare_occurred'].isin(flare_occurred)]
-        
-        # Calculate dynamic flare totals based on selected classes
-        flare_totals = {}
-        if 'X' in flare_classes:
-            x_count = flare_filtered['x_class_flares'].sum()
-            if x_count > 0:
-                flare_totals['X-Class'] = x_count
-        if 'M' in flare_classes:
-            m_count = flare_filtered['m_class_flares'].sum()
-            if m_count > 0:
-                flare_totals['M-Class'] = m_count
-        if 'C' in flare_classes:
-            c_count = flare_filtered['c_class_flares'].sum()
-            if c_count > 0:
-                flare_totals['C-Class'] = c_count
-        
-        if not flare_totals:
-            flare_totals = {'No Data': 0}
-        
-        # Sunrise Orange Theme for Flare Distribution
-        color_map = {
-            'X-Class': '#FF4500',  # Orange Red
-            'M-Class': '#FF8C00',  # Dark Orange
-            'C-Class': '#FFA500',  # Orange
-            'B-Class': '#FFB347',  # Peach
-            'A-Class': '#FFD700'   # Gold
-        }
-        colors_list = [color_map.get(label, '#FFB366') for label in flare_totals.keys()]
-        
-        # Create a more prominent donut chart with better visibility
-        fig = go.Figure(data=[go.Pie(
-            labels=list(flare_totals.keys()),
-            values=list(flare_totals.values()),
-            hole=0.4,  # Smaller hole for more visible data
-            marker_colors=colors_list,
-            textinfo='label+value+percent',
-            textfont_size=16,
-            textfont_color='white',
-            textfont_family='Inter',
-            hovertemplate='<b>%{label}</b><br>Flare Count: %{value:,}<br>Percentage: %{percent}<br><extra></extra>',
-            marker_line=dict(color='white', width=3),
-            rotation=0,  # Start from top
-            pull=[0.15, 0.1, 0.05],  # More prominent pull for visual appeal
-            textposition='inside',
-            insidetextorientation='radial'
-        )])
-        
-        # Add center annotation showing total flares
-        total_flares = sum(flare_totals.values())
-        
-        fig.update_layout(
-            template='none',
-            height=450,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            showlegend=True,
-            legend=dict(
-                orientation="v", 
-                yanchor="middle", 
-                y=0.5, 
-                xanchor="left", 
-                x=1.02,
-                bgcolor='rgba(255, 255, 255, 0.9)',
-                bordercolor='rgba(255, 107, 53, 0.5)',
-                borderwidth=2,
-                font=dict(size=14, color='#2C3E50', family='Inter')
-            ),
-            margin=dict(t=80, b=60, l=60, r=120),
-            hoverlabel=dict(
-                bgcolor='rgba(255, 255, 255, 0.95)', 
-                bordercolor='#FF6B35', 
-                font=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-            annotations=[
-                dict(
-                    text=f"<b>Total Flares</b><br>{total_flares:,}",
-                    x=0.5, y=0.5,
-                    font_size=16,
-                    font_color='#2C3E50',
-                    font_family='Inter',
-                    showarrow=False,
-                    xref='paper',
-                    yref='paper'
-                )
-            ]
-        )
-        
-        return fig
+        return flare_class_distribution_figure(start_date, end_date, tuple(flare_classes), tuple(magnetic_types), tuple(sunspot_range), tuple(flare_occurred))
     except Exception as e:
-        return go.Figure().add_annotation(text="Error loading data", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_flare_class_distribution: %s", e)
+        return _ERROR_FIG
 
 # Callback for solar cycle phase
 @app.callback(
@@ -3435,63 +3602,33 @@ def update_solar_cycle_phase(start_date, end_date, cycle_phases):
         raise PreventUpdate
     
     try:
-        sunspot_filtered = sunspot_df[
-            (sunspot_df['date'] >= start_date) & 
-            (sunspot_df['date'] <= end_date) &
-            (sunspot_df['solar_cycle_phase'].isin(cycle_phases))
-        ]
-        
-        phase_counts = sunspot_filtered['solar_cycle_phase'].value_counts()
+        # Count the phase codes in the date range, then keep the selected phases
+        sun_lo, sun_hi = date_bounds(_SUN_DATES, start_date.to_datetime64(), end_date.to_datetime64())
+        phase_codes = _SUNSPOT_CYCLE_CODE[sun_lo:sun_hi]
+        phase_names, phase_values = category_counts(phase_codes[phase_codes >= 0], _CYCLE_NAMES)
+        selected = np.isin(phase_names, list(cycle_phases))
+        phase_names, phase_values = phase_names[selected], phase_values[selected]
         
         color_map = {'Rising': '#FF6B35', 'Peak': '#DC3545', 
                      'Declining': '#F7931E', 'Minimum': '#6C757D'}
-        colors_list = [color_map.get(phase, '#6C757D') for phase in phase_counts.index]
+        colors_list = [color_map.get(phase, '#6C757D') for phase in phase_names]
         
         fig = go.Figure(data=[go.Bar(
-            x=phase_counts.index,
-            y=phase_counts.values,
+            x=phase_names,
+            y=phase_values,
             marker_color=colors_list,
             marker_line=dict(color='white', width=3),
-            text=phase_counts.values,
+            text=phase_values,
             textposition='auto',
             textfont=dict(color='white', size=16, family='Inter')
         )])
         
-        fig.update_layout(
-            title=dict(text="Solar Cycle Phase Distribution", 
-                      font=dict(size=22, color='#2C3E50', family='Inter')),
-            xaxis=dict(
-                title=dict(text="Phase", font=dict(size=14, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)', 
-                showgrid=True,
-                linecolor='rgba(255, 107, 53, 0.3)',
-                tickfont=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Count", font=dict(size=14, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)', 
-                showgrid=True,
-                linecolor='rgba(255, 107, 53, 0.3)',
-                tickfont=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-            template='none',
-            height=450,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=80, l=80, r=80),
-            hoverlabel=dict(
-                bgcolor='rgba(255, 255, 255, 0.95)', 
-                bordercolor='#FF6B35', 
-                font=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-        )
+        fig.update_layout(_LAYOUT_CYCLE_PHASE)
         
         return fig
     except Exception as e:
-        return go.Figure().add_annotation(text="Error loading data", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_solar_cycle_phase: %s", e)
+        return _ERROR_FIG
 
 # Callback for magnetic complexity
 @app.callback(
@@ -3514,62 +3651,70 @@ def update_magnetic_complexity(start_date, end_date):
         raise PreventUpdate
     
     try:
-        flare_filtered = solar_flare_df[
-            (solar_flare_df['observation_date'] >= start_date) & 
-            (solar_flare_df['observation_date'] <= end_date)
-        ]
-        
-        complexity_counts = flare_filtered['magnetic_complexity'].value_counts()
+        # Count the magnetic complexity codes in the date range
+        lo, hi = date_bounds(_FLARE_DATES, start_date.to_datetime64(), end_date.to_datetime64())
+        complexity_names, complexity_values = category_counts(_FLARE_MAG_CODE[lo:hi], _MAG_NAMES)
         
         color_map = {'Alpha': '#FF6B35', 'Beta': '#F7931E', 
                      'Gamma': '#DC3545', 'Delta': '#6C757D'}
-        colors_list = [color_map.get(complexity, '#6C757D') for complexity in complexity_counts.index]
+        colors_list = [color_map.get(complexity, '#6C757D') for complexity in complexity_names]
         
         fig = go.Figure(data=[go.Bar(
-            x=complexity_counts.index,
-            y=complexity_counts.values,
+            x=complexity_names,
+            y=complexity_values,
             marker_color=colors_list,
             marker_line=dict(color='white', width=3),
-            text=complexity_counts.values,
+            text=complexity_values,
             textposition='auto',
             textfont=dict(color='white', size=16, family='Inter')
         )])
         
-        fig.update_layout(
-            title=dict(text="Magnetic Complexity Distribution", 
-                      font=dict(size=22, color='#2C3E50', family='Inter')),
-            xaxis=dict(
-                title=dict(text="Complexity Type", font=dict(size=14, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)', 
-                showgrid=True,
-                linecolor='rgba(255, 107, 53, 0.3)',
-                tickfont=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Count", font=dict(size=14, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)', 
-                showgrid=True,
-                linecolor='rgba(255, 107, 53, 0.3)',
-                tickfont=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-            template='none',
-            height=450,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=80, l=80, r=80),
-            hoverlabel=dict(
-                bgcolor='rgba(255, 255, 255, 0.95)', 
-                bordercolor='#FF6B35', 
-                font=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-        )
+        fig.update_layout(_LAYOUT_MAGNETIC_COMPLEXITY)
         
         return fig
     except Exception as e:
-        return go.Figure().add_annotation(text="Error loading data", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_magnetic_complexity: %s", e)
+        return _ERROR_FIG
+
+@lru_cache(maxsize=16)
+def correlation_matrix_figure(start_date, end_date):
+    """Build the correlation heatmap for a date range, memoized on the range"""
+    combined_filtered = combined_df.loc[start_date:end_date]
+    
+    numeric_cols = ['sunspot_count', 'flare_index', 'x_class_flares', 'm_class_flares', 
+                   'c_class_flares', 'total_sunspots', 'solar_flux']
+    
+    corr_matrix = combined_filtered[numeric_cols].corr()
+    
+    fig = go.Figure(data=go.Heatmap(
+        z=corr_matrix.values,
+        x=corr_matrix.columns,
+        y=corr_matrix.columns,
+        colorscale='RdBu',
+        zmid=0,
+        text=np.round(corr_matrix.values, 2),
+        texttemplate="%{text}",
+        textfont={"size": 12, "family": "Inter"},
+        hovertemplate='<b>%{y} vs %{x}</b><br>Correlation: %{z:.3f}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=dict(text="Correlation Matrix", 
+                  font=dict(size=22, color='#2C3E50', family='Inter')),
+        template='none',
+        height=500,
+        plot_bgcolor='rgba(255, 255, 255, 0.1)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter', color='#2C3E50'),
+        margin=dict(t=80, b=80, l=80, r=80),
+        hoverlabel=dict(
+            bgcolor='rgba(255, 255, 255, 0.95)', 
+            bordercolor='#FF6B35', 
+            font=dict(size=12, color='#2C3E50', family='Inter')
+        ),
+    )
+    
+    return fig.to_dict()
 
 # Callback for correlation matrix
 @app.callback(
@@ -3592,63 +3737,71 @@ def update_correlation_matrix(start_date, end_date):
         raise PreventUpdate
     
     try:
-        flare_daily = solar_flare_df.groupby('observation_date').agg({
-            'sunspot_count': 'mean',
-            'flare_index': 'mean',
-            'x_class_flares': 'sum',
-            'm_class_flares': 'sum',
-            'c_class_flares': 'sum'
-        }).reset_index()
-        
-        combined = pd.merge(
-            flare_daily, 
-            sunspot_df[['date', 'total_sunspots', 'solar_flux']], 
-            left_on='observation_date', 
-            right_on='date', 
-            how='inner'
-        )
-        
-        combined_filtered = combined[
-            (combined['observation_date'] >= start_date) & 
-            (combined['observation_date'] <= end_date)
-        ]
-        
-        numeric_cols = ['sunspot_count', 'flare_index', 'x_class_flares', 'm_class_flares', 
-                       'c_class_flares', 'total_sunspots', 'solar_flux']
-        
-        corr_matrix = combined_filtered[numeric_cols].corr()
-        
-        fig = go.Figure(data=go.Heatmap(
-            z=corr_matrix.values,
-            x=corr_matrix.columns,
-            y=corr_matrix.columns,
-            colorscale='RdBu',
-            zmid=0,
-            text=np.round(corr_matrix.values, 2),
-            texttemplate="%{text}",
-            textfont={"size": 12, "family": "Inter"},
-            hovertemplate='<b>%{y} vs %{x}</b><br>Correlation: %{z:.3f}<extra></extra>'
-        ))
-        
-        fig.update_layout(
-            title=dict(text="Correlation Matrix", 
-                      font=dict(size=22, color='#2C3E50', family='Inter')),
-            template='none',
-            height=500,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=80, l=80, r=80),
-            hoverlabel=dict(
-                bgcolor='rgba(255, 255, 255, 0.95)', 
-                bordercolor='#FF6B35', 
-                font=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-        )
-        
-        return fig
+        return correlation_matrix_figure(start_date, end_date)
     except Exception as e:
-        return go.Figure().add_annotation(text="Error loading data", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_correlation_matrix: %s", e)
+        return _ERROR_FIG
+
+@lru_cache(maxsize=16)
+def solar_wind_flare_figure(start_date, end_date):
+    """Build the solar wind vs flare index scatter for a date range, memoized on the range"""
+    combined_filtered = combined_df.loc[start_date:end_date]
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=combined_filtered['avg_solar_wind_speed'],
+        y=combined_filtered['flare_index'],
+        mode='markers',
+        name='Flare Index vs Solar Wind',
+        marker=dict(
+            size=16,
+            color=combined_filtered['x_class_flares'] + combined_filtered['m_class_flares'],
+            colorscale='Viridis',
+            showscale=True,
+            colorbar=dict(title="High-Class Flares", titlefont=dict(family='Inter')),
+            line=dict(width=3, color='white')
+        ),
+        text=combined_filtered.index.strftime('%Y-%m-%d'),
+        hovertemplate='<b>%{text}</b><br>' +
+                     'Solar Wind Speed: %{x:.1f} km/s<br>' +
+                     'Flare Index: %{y:.2f}<br>' +
+                     '<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=dict(text="Solar Wind Speed vs Flare Activity", 
+                  font=dict(size=22, color='#2C3E50', family='Inter')),
+        xaxis=dict(
+            title=dict(text="Average Solar Wind Speed (km/s)", font=dict(size=14, color='#2C3E50', family='Inter')),
+            color='#2C3E50', 
+            gridcolor='rgba(255, 107, 53, 0.15)', 
+            showgrid=True,
+            linecolor='rgba(255, 107, 53, 0.3)',
+            tickfont=dict(size=12, color='#2C3E50', family='Inter')
+        ),
+        yaxis=dict(
+            title=dict(text="Flare Index", font=dict(size=14, color='#2C3E50', family='Inter')),
+            color='#2C3E50', 
+            gridcolor='rgba(255, 107, 53, 0.15)', 
+            showgrid=True,
+            linecolor='rgba(255, 107, 53, 0.3)',
+            tickfont=dict(size=12, color='#2C3E50', family='Inter')
+        ),
+        template='none',
+        height=500,
+        plot_bgcolor='rgba(255, 255, 255, 0.1)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter', color='#2C3E50'),
+        margin=dict(t=80, b=80, l=80, r=80),
+        hoverlabel=dict(
+            bgcolor='rgba(255, 255, 255, 0.95)', 
+            bordercolor='#FF6B35', 
+            font=dict(size=12, color='#2C3E50', family='Inter')
+        ),
+    )
+    
+    return fig.to_dict()
 
 # Callback for solar wind vs flare activity
 @app.callback(
@@ -3671,82 +3824,27 @@ def update_solar_wind_flare(start_date, end_date):
         raise PreventUpdate
     
     try:
-        flare_daily = solar_flare_df.groupby('observation_date').agg({
-            'flare_index': 'mean',
-            'x_class_flares': 'sum',
-            'm_class_flares': 'sum'
-        }).reset_index()
-        
-        combined = pd.merge(
-            flare_daily, 
-            sunspot_df[['date', 'avg_solar_wind_speed']], 
-            left_on='observation_date', 
-            right_on='date', 
-            how='inner'
-        )
-        
-        combined_filtered = combined[
-            (combined['observation_date'] >= start_date) & 
-            (combined['observation_date'] <= end_date)
-        ]
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=combined_filtered['avg_solar_wind_speed'],
-            y=combined_filtered['flare_index'],
-            mode='markers',
-            name='Flare Index vs Solar Wind',
-            marker=dict(
-                size=16,
-                color=combined_filtered['x_class_flares'] + combined_filtered['m_class_flares'],
-                colorscale='Viridis',
-                showscale=True,
-                colorbar=dict(title="High-Class Flares", titlefont=dict(family='Inter')),
-                line=dict(width=3, color='white')
-            ),
-            text=combined_filtered['observation_date'].dt.strftime('%Y-%m-%d'),
-            hovertemplate='<b>%{text}</b><br>' +
-                         'Solar Wind Speed: %{x:.1f} km/s<br>' +
-                         'Flare Index: %{y:.2f}<br>' +
-                         '<extra></extra>'
-        ))
-        
-        fig.update_layout(
-            title=dict(text="Solar Wind Speed vs Flare Activity", 
-                      font=dict(size=22, color='#2C3E50', family='Inter')),
-            xaxis=dict(
-                title=dict(text="Average Solar Wind Speed (km/s)", font=dict(size=14, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)', 
-                showgrid=True,
-                linecolor='rgba(255, 107, 53, 0.3)',
-                tickfont=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Flare Index", font=dict(size=14, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)', 
-                showgrid=True,
-                linecolor='rgba(255, 107, 53, 0.3)',
-                tickfont=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-            template='none',
-            height=500,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=80, l=80, r=80),
-            hoverlabel=dict(
-                bgcolor='rgba(255, 255, 255, 0.95)', 
-                bordercolor='#FF6B35', 
-                font=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-        )
-        
-        return fig
+        return solar_wind_flare_figure(start_date, end_date)
     except Exception as e:
-        return go.Figure().add_annotation(text="Error loading data", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_solar_wind_flare: %s", e)
+        return _ERROR_FIG
+
+_LAYOUT_REGION = dict(
+    **_LAYOUT_BASE,
+    title=dict(text="Solar Region Distribution", 
+              font=dict(size=22, color='#2C3E50', family='Inter')),
+    xaxis=dict(
+        title=dict(text="Solar Longitude (°)", font=dict(size=14, color='#2C3E50', family='Inter')),
+        **_AXIS_STYLE
+    ),
+    yaxis=dict(
+        title=dict(text="Solar Latitude (°)", font=dict(size=14, color='#2C3E50', family='Inter')),
+        **_AXIS_STYLE
+    ),
+    height=500,
+    margin=dict(t=80, b=80, l=80, r=80),
+    hoverlabel=_HOVERLABEL
+)
 
 # Callback for solar region map
 @app.callback(
@@ -3769,14 +3867,12 @@ def update_solar_region_map(start_date, end_date):
         raise PreventUpdate
     
     try:
-        flare_filtered = solar_flare_df[
-            (solar_flare_df['observation_date'] >= start_date) & 
-            (solar_flare_df['observation_date'] <= end_date)
-        ]
+        lo, hi = date_bounds(_FLARE_DATES, start_date.to_datetime64(), end_date.to_datetime64())
+        flare_filtered = solar_flare_df.iloc[lo:hi][['solar_longitude', 'solar_latitude', 'region_area', 'flare_index', 'region_id']]
         
         fig = go.Figure()
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=flare_filtered['solar_longitude'],
             y=flare_filtered['solar_latitude'],
             mode='markers',
@@ -3791,49 +3887,21 @@ def update_solar_region_map(start_date, end_date):
                 line=dict(width=3, color='white')
             ),
             text=flare_filtered['region_id'],
+            customdata=np.column_stack([_REGION_AREA_STR[lo:hi], _FLARE_INDEX_STR[lo:hi]]),
             hovertemplate='<b>%{text}</b><br>' +
                          'Latitude: %{y:.1f}°<br>' +
                          'Longitude: %{x:.1f}°<br>' +
-                         'Region Area: ' + flare_filtered['region_area'].astype(str) + '<br>' +
-                         'Flare Index: ' + flare_filtered['flare_index'].astype(str) + '<br>' +
+                         'Region Area: %{customdata[0]}<br>' +
+                         'Flare Index: %{customdata[1]}<br>' +
                          '<extra></extra>'
         ))
         
-        fig.update_layout(
-            title=dict(text="Solar Region Distribution", 
-                      font=dict(size=22, color='#2C3E50', family='Inter')),
-            xaxis=dict(
-                title=dict(text="Solar Longitude (°)", font=dict(size=14, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)', 
-                showgrid=True,
-                linecolor='rgba(255, 107, 53, 0.3)',
-                tickfont=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Solar Latitude (°)", font=dict(size=14, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)', 
-                showgrid=True,
-                linecolor='rgba(255, 107, 53, 0.3)',
-                tickfont=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-            template='none',
-            height=500,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=80, l=80, r=80),
-            hoverlabel=dict(
-                bgcolor='rgba(255, 255, 255, 0.95)', 
-                bordercolor='#FF6B35', 
-                font=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-        )
+        fig.update_layout(**_LAYOUT_REGION)
         
         return fig
     except Exception as e:
-        return go.Figure().add_annotation(text="Error loading data", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_solar_region_map: %s", e)
+        return _ERROR_FIG
 
 
 # Enhanced metrics callback with interval component for real-time updates
@@ -3843,7 +3911,8 @@ def update_solar_region_map(start_date, end_date):
      Output('max-flare-index', 'children'),
      Output('active-regions', 'children'),
      Output('x-class-flares', 'children'),
-     Output('solar-wind-speed', 'children')],
+     Output('solar-wind-speed', 'children'),
+     Output('metrics-key', 'data')],
     [Input('interval-component', 'n_intervals'),
      Input('start-date-picker', 'date'),
      Input('end-date-picker', 'date'),
@@ -3851,158 +3920,150 @@ def update_solar_region_map(start_date, end_date):
      Input('magnetic-complexity-filter', 'value'),
      Input('sunspot-count-slider', 'value'),
      Input('flare-occurred-filter', 'value')],
+    [State('metrics-key', 'data')],
     prevent_initial_call=False
 )
+@skip_unchanged(lambda n_intervals, *filters: flare_store_key(*filters))
 def update_metrics_enhanced(n_intervals, start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
     """Enhanced real-time metrics update with interval component"""
     try:
-        # Handle None dates
-        if start_date is None:
-            start_date = solar_flare_df['observation_date'].min()
-        if end_date is None:
-            end_date = solar_flare_df['observation_date'].max()
-        
-        # Convert to datetime if strings
-        start_date = pd.to_datetime(start_date)
-        end_date = pd.to_datetime(end_date)
-        
-        # Handle None filters
-        if flare_classes is None or len(flare_classes) == 0:
-            flare_classes = ['X', 'M', 'C']
-        if magnetic_types is None or len(magnetic_types) == 0:
-            magnetic_types = ['Alpha', 'Beta', 'Gamma', 'Delta']
-        if sunspot_range is None or len(sunspot_range) < 2:
-            sunspot_range = [float(solar_flare_df['sunspot_count'].min()), float(solar_flare_df['sunspot_count'].max())]
-        if flare_occurred is None or len(flare_occurred) == 0:
-            flare_occurred = [0, 1]
+        start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred = normalize_filters(
+            start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred)
     except Exception as e:
         raise PreventUpdate
     
     try:
         # Filter data
-        flare_filtered = solar_flare_df[
-            (solar_flare_df['observation_date'] >= start_date) & 
-            (solar_flare_df['observation_date'] <= end_date) &
-            (solar_flare_df['magnetic_complexity'].isin(magnetic_types)) &
-            (solar_flare_df['sunspot_count'] >= sunspot_range[0]) &
-            (solar_flare_df['sunspot_count'] <= sunspot_range[1]) &
-            (solar_flare_df['flare_occurred'].isin(flare_occurred))
-        ].copy()
+        idx = filtered_indices(*filter_key(start_date, end_date, (), magnetic_types, sunspot_range, flare_occurred))
         
-        sunspot_filtered = sunspot_df[
-            (sunspot_df['date'] >= start_date) & 
-            (sunspot_df['date'] <= end_date)
-        ].copy()
+        sun_lo, sun_hi = date_bounds(_SUN_DATES, start_date, end_date)
+        sunspot_filtered = sunspot_df.iloc[sun_lo:sun_hi]
         
-        # Calculate diverse and meaningful metrics
-        total_flares = flare_filtered['x_class_flares'].sum() + flare_filtered['m_class_flares'].sum() + flare_filtered['c_class_flares'].sum()
+        # Calculate diverse and meaningful metrics straight from the flare arrays
+        xmc = _FLARE_XMC[idx].sum(axis=0)
+        total_flares = int(xmc.sum())
         avg_sunspots = sunspot_filtered['total_sunspots'].mean() if len(sunspot_filtered) > 0 else 0
-        max_flare_index = flare_filtered['flare_index'].max() if len(flare_filtered) > 0 else 0
-        active_regions = flare_filtered['region_id'].nunique() if len(flare_filtered) > 0 else 0
-        m_class_flares = flare_filtered['m_class_flares'].sum()  # Changed from X-class to M-class
+        max_flare_index = _FLARE_INDEX[idx].max() if len(idx) > 0 else 0
+        active_regions = np.count_nonzero(np.bincount(_FLARE_REGION_CODE[idx]))
+        m_class_flares = int(xmc[1])  # Changed from X-class to M-class
         solar_flux_avg = sunspot_filtered['solar_flux'].mean() if len(sunspot_filtered) > 0 else 0  # Changed from wind speed to solar flux
         
         return (f"{total_flares:,.0f}", f"{avg_sunspots:.0f}", f"{max_flare_index:.0f}", 
                 f"{active_regions:,}", f"{m_class_flares:,.0f}", f"{solar_flux_avg:.0f}")
     except Exception as e:
-        print(f"ERROR in update_metrics_enhanced: {str(e)}")
+        app.logger.warning("ERROR in update_metrics_enhanced: %s", e)
         return ("0", "0", "0", "0", "0", "0")
 
 # Advanced Interactive Charts Callbacks
 
 
+_LAYOUT_DONUT = dict(
+    **_LAYOUT_BASE,
+    height=400,
+    margin=dict(t=60, b=50, l=50, r=50),
+    showlegend=True,
+    legend=dict(
+        bgcolor='rgba(255, 255, 255, 0.8)',
+        bordercolor='rgba(255, 107, 53, 0.3)',
+        font=dict(size=10, color='#2C3E50', family='Inter')
+    )
+)
+
+# Sunrise Orange Theme for Solar Cycle Phases
+_DONUT_COLOR_MAP = {
+    'Rising': '#FF4500',    # Orange Red
+    'Maximum': '#FF8C00',   # Dark Orange
+    'Falling': '#FFA500',   # Orange
+    'Minimum': '#FFD700'    # Gold
+}
+_DONUT_COLORS = np.array([_DONUT_COLOR_MAP.get(label, '#FF6B35') for label in _CYCLE_NAMES])
+_DONUT_PARENTS = np.full(len(_CYCLE_NAMES), '')
+
+# Treemap styling and layout validated once; the callback only fills in the per-phase arrays
+_DONUT_FIGURE = go.Figure(data=[go.Treemap(
+    marker=dict(line=dict(color='white', width=3)),
+    textinfo='label+value+percent parent',
+    textfont=dict(size=14, color='white', family='Inter'),
+    hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percentParent}<br><extra></extra>'
+)], layout=_LAYOUT_DONUT).to_dict()
+
 # Interactive Donut Chart
 @app.callback(
-    Output('magnetic-donut-chart', 'figure'),
+    [Output('magnetic-donut-chart', 'figure'),
+     Output('magnetic-donut-chart-key', 'data')],
     [Input('start-date-picker', 'date'),
      Input('end-date-picker', 'date'),
      Input('flare-class-filter', 'value'),
      Input('magnetic-complexity-filter', 'value'),
      Input('sunspot-count-slider', 'value'),
-     Input('flare-occurred-filter', 'value')]
+     Input('flare-occurred-filter', 'value')],
+    [State('magnetic-donut-chart-key', 'data')]
 )
+@skip_unchanged(sunspot_store_key, patch_data=True)
 def update_magnetic_donut_chart(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
     try:
-        # Handle None dates
-        if start_date is None:
-            start_date = solar_flare_df['observation_date'].min()
-        if end_date is None:
-            end_date = solar_flare_df['observation_date'].max()
-        
-        # Convert to datetime if strings
-        start_date = pd.to_datetime(start_date)
-        end_date = pd.to_datetime(end_date)
-        
-        # Handle None filters
-        if flare_classes is None or len(flare_classes) == 0:
-            flare_classes = ['X', 'M', 'C']
-        if magnetic_types is None or len(magnetic_types) == 0:
-            magnetic_types = ['Alpha', 'Beta', 'Gamma', 'Delta']
-        if sunspot_range is None or len(sunspot_range) < 2:
-            sunspot_range = [float(solar_flare_df['sunspot_count'].min()), float(solar_flare_df['sunspot_count'].max())]
-        if flare_occurred is None or len(flare_occurred) == 0:
-            flare_occurred = [0, 1]
+        start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred = normalize_filters(
+            start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred)
     except Exception as e:
         raise PreventUpdate
     
     try:
-        # Filter sunspot data for solar cycle phases
-        sunspot_filtered = sunspot_df[
-            (sunspot_df['date'] >= start_date) & 
-            (sunspot_df['date'] <= end_date) &
-            (sunspot_df['total_sunspots'] >= sunspot_range[0]) &
-            (sunspot_df['total_sunspots'] <= sunspot_range[1])
-        ].copy()
-        
-        if len(sunspot_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available for selected filters", 
-                                            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        
-        # Calculate solar cycle phases distribution
-        cycle_counts = sunspot_filtered['solar_cycle_phase'].value_counts()
-        
-        # Sunrise Orange Theme for Solar Cycle Phases
-        color_map = {
-            'Rising': '#FF4500',    # Orange Red
-            'Maximum': '#FF8C00',   # Dark Orange
-            'Falling': '#FFA500',   # Orange
-            'Minimum': '#FFD700'    # Gold
+        # Filter sunspot data for solar cycle phases: date range as a slice, then the sunspot range over it
+        sun_lo, sun_hi = date_bounds(_SUN_DATES, start_date, end_date)
+        if sun_hi == sun_lo:
+            return _EMPTY_FIG
+        
+        sunspots = _SUN_TOTALS[sun_lo:sun_hi]
+        sunspot_mask = (sunspots >= sunspot_range[0]) & (sunspots <= sunspot_range[1])
+        
+        if not sunspot_mask.any():
+            return _EMPTY_FIG
+        
+        # Calculate solar cycle phases distribution, leaving out phases with no months
+        cycle_counts = np.bincount(_SUNSPOT_CYCLE_CODE[sun_lo:sun_hi][sunspot_mask], minlength=len(_CYCLE_NAMES))
+        shown = cycle_counts > 0
+        
+        # Fill the prebuilt treemap; Dash serializes the figure dict as is
+        trace = _DONUT_FIGURE['data'][0]
+        fig = {
+            'data': [dict(
+                trace,
+                labels=_CYCLE_NAMES[shown],
+                values=cycle_counts[shown],
+                parents=_DONUT_PARENTS[shown],
+                marker=dict(trace['marker'], colors=_DONUT_COLORS[shown])
+            )],
+            'layout': _DONUT_FIGURE['layout']
         }
-        colors_list = [color_map.get(label, '#FF6B35') for label in cycle_counts.index]
-        
-        # Create interactive treemap
-        fig = go.Figure(data=[go.Treemap(
-            labels=cycle_counts.index,
-            values=cycle_counts.values,
-            parents=[''] * len(cycle_counts),
-            marker=dict(
-                colors=colors_list,
-                line=dict(color='white', width=3)
-            ),
-            textinfo='label+value+percent parent',
-            textfont=dict(size=14, color='white', family='Inter'),
-            hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percentParent}<br><extra></extra>'
-        )])
-        
-        fig.update_layout(
-            template='none',
-            height=400,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=60, b=50, l=50, r=50),
-            showlegend=True,
-            legend=dict(
-                bgcolor='rgba(255, 255, 255, 0.8)',
-                bordercolor='rgba(255, 107, 53, 0.3)',
-                font=dict(size=10, color='#2C3E50', family='Inter')
-            )
-        )
         
         return fig
     except Exception as e:
-        print(f"ERROR in update_magnetic_donut_chart: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_magnetic_donut_chart: %s", e)
+        return _ERROR_FIG
+
+_LAYOUT_BUBBLE = dict(
+    **_LAYOUT_BASE,
+    title=dict(text="Solar Activity Bubble Analysis", 
+              font=dict(size=20, color='#2C3E50', family='Inter')),
+    xaxis=dict(
+        title=dict(text="Sunspot Count", font=dict(size=16, color='#FF6B35', family='Inter')),
+        color='#FF6B35', 
+        gridcolor='rgba(255, 107, 53, 0.3)',
+        linecolor='rgba(255, 107, 53, 0.8)',
+        linewidth=2,
+        tickfont=dict(size=14, color='#FF6B35', family='Inter')
+    ),
+    yaxis=dict(
+        title=dict(text="Flare Index", font=dict(size=16, color='#FF6B35', family='Inter')),
+        color='#FF6B35', 
+        gridcolor='rgba(255, 107, 53, 0.3)',
+        linecolor='rgba(255, 107, 53, 0.8)',
+        linewidth=2,
+        tickfont=dict(size=14, color='#FF6B35', family='Inter')
+    ),
+    height=600,  # Made larger
+    margin=dict(t=80, b=80, l=80, r=80)  # Increased margins for larger chart
+)
 
 # Interactive Bubble Chart
 @app.callback(
@@ -4016,56 +4077,33 @@ def update_magnetic_donut_chart(start_date, end_date, flare_classes, magnetic_ty
 )
 def update_solar_box_plot(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
     try:
-        # Handle None dates
-        if start_date is None:
-            start_date = solar_flare_df['observation_date'].min()
-        if end_date is None:
-            end_date = solar_flare_df['observation_date'].max()
-        
-        # Convert to datetime if strings
-        start_date = pd.to_datetime(start_date)
-        end_date = pd.to_datetime(end_date)
-        
-        # Handle None filters
-        if flare_classes is None or len(flare_classes) == 0:
-            flare_classes = ['X', 'M', 'C']
-        if magnetic_types is None or len(magnetic_types) == 0:
-            magnetic_types = ['Alpha', 'Beta', 'Gamma', 'Delta']
-        if sunspot_range is None or len(sunspot_range) < 2:
-            sunspot_range = [float(solar_flare_df['sunspot_count'].min()), float(solar_flare_df['sunspot_count'].max())]
-        if flare_occurred is None or len(flare_occurred) == 0:
-            flare_occurred = [0, 1]
+        start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred = normalize_filters(
+            start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred)
     except Exception as e:
         raise PreventUpdate
     
     try:
         # Filter data
-        flare_filtered = solar_flare_df[
-            (solar_flare_df['observation_date'] >= start_date) & 
-            (solar_flare_df['observation_date'] <= end_date) &
-            (solar_flare_df['magnetic_complexity'].isin(magnetic_types)) &
-            (solar_flare_df['sunspot_count'] >= sunspot_range[0]) &
-            (solar_flare_df['sunspot_count'] <= sunspot_range[1]) &
-            (solar_flare_df['flare_occurred'].isin(flare_occurred))
-        ].copy()
+        idx = filtered_indices(*filter_key(start_date, end_date, (), magnetic_types, sunspot_range, flare_occurred))
         
-        if len(flare_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available for selected filters", 
-                                            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        if len(idx) == 0:
+            return _EMPTY_FIG
+        
+        # Sample rows for bubble chart (reduced for performance); the fixed seed keeps redraws stable
+        rows = idx[np.random.default_rng(0).choice(len(idx), size=min(100, len(idx)), replace=False)]
         
-        # Sample data for bubble chart (reduced for performance)
-        sample_data = flare_filtered.sample(min(100, len(flare_filtered)))
+        sizes = _FLARE_XMC[rows].sum(axis=1)
         
-        # Beautiful Orange Theme for Solar Activity Bubble
-        fig = go.Figure(data=[go.Scatter(
-            x=sample_data['sunspot_count'],
-            y=sample_data['flare_index'],
+        # Beautiful Orange Theme for Solar Activity Bubble (WebGL keeps hover picking cheap)
+        fig = go.Figure(data=[go.Scattergl(
+            x=_FLARE_SUNSPOTS[rows],
+            y=_FLARE_INDEX[rows],
             mode='markers',
             marker=dict(
-                size=sample_data['x_class_flares'] + sample_data['m_class_flares'] + sample_data['c_class_flares'],
-                sizemode='diameter',
-                sizeref=1.5,  # Smaller reference for larger bubbles
-                color=sample_data['flare_index'],
+                size=sizes,
+                sizemode='area',
+                sizeref=2. * max(sizes.max(), 1) / (40. ** 2),  # Largest bubble ~40px across
+                color=_FLARE_INDEX[rows],
                 colorscale=[[0, '#FFF3E0'], [0.3, '#FFB74D'], [0.6, '#FF8A65'], [1, '#F7931E']],  # Orange gradient
                 opacity=0.8,
                 line=dict(width=3, color='white'),
@@ -4075,42 +4113,25 @@ def update_solar_box_plot(start_date, end_date, flare_classes, magnetic_types, s
                     tickfont=dict(size=10, color='#F7931E', family='Inter')
                 )
             ),
-            text=sample_data['magnetic_complexity'],
+            text=_FLARE_MAGNETIC[rows],
             hovertemplate='<b>Sunspots:</b> %{x}<br><b>Flare Index:</b> %{y}<br><b>Total Flares:</b> %{marker.size}<br><b>Magnetic:</b> %{text}<br><extra></extra>'
         )])
         
-        fig.update_layout(
-            title=dict(text="Solar Activity Bubble Analysis", 
-                      font=dict(size=20, color='#2C3E50', family='Inter')),
-            xaxis=dict(
-                title=dict(text="Sunspot Count", font=dict(size=16, color='#FF6B35', family='Inter')),
-                color='#FF6B35', 
-                gridcolor='rgba(255, 107, 53, 0.3)',
-                linecolor='rgba(255, 107, 53, 0.8)',
-                linewidth=2,
-                tickfont=dict(size=14, color='#FF6B35', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Flare Index", font=dict(size=16, color='#FF6B35', family='Inter')),
-                color='#FF6B35', 
-                gridcolor='rgba(255, 107, 53, 0.3)',
-                linecolor='rgba(255, 107, 53, 0.8)',
-                linewidth=2,
-                tickfont=dict(size=14, color='#FF6B35', family='Inter')
-            ),
-            template='none',
-            height=600,  # Made larger
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=80, l=80, r=80)  # Increased margins for larger chart
-        )
+        fig.update_layout(**_LAYOUT_BUBBLE)
         
         return fig
     except Exception as e:
-        print(f"ERROR in update_solar_bubble_chart: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_solar_bubble_chart: %s", e)
+        return _ERROR_FIG
+
 
+_LAYOUT_TREEMAP = dict(
+    **_LAYOUT_BASE,
+    title=dict(text="Activity Treemap", 
+              font=dict(size=16, color='#2C3E50', family='Inter')),
+    height=400,
+    margin=dict(t=60, b=50, l=50, r=50)
+)
 
 # Interactive Treemap
 @app.callback(
@@ -4124,51 +4145,26 @@ def update_solar_box_plot(start_date, end_date, flare_classes, magnetic_types, s
 )
 def update_solar_violin_plot(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
     try:
-        # Handle None dates
-        if start_date is None:
-            start_date = solar_flare_df['observation_date'].min()
-        if end_date is None:
-            end_date = solar_flare_df['observation_date'].max()
-        
-        # Convert to datetime if strings
-        start_date = pd.to_datetime(start_date)
-        end_date = pd.to_datetime(end_date)
-        
-        # Handle None filters
-        if flare_classes is None or len(flare_classes) == 0:
-            flare_classes = ['X', 'M', 'C']
-        if magnetic_types is None or len(magnetic_types) == 0:
-            magnetic_types = ['Alpha', 'Beta', 'Gamma', 'Delta']
-        if sunspot_range is None or len(sunspot_range) < 2:
-            sunspot_range = [float(solar_flare_df['sunspot_count'].min()), float(solar_flare_df['sunspot_count'].max())]
-        if flare_occurred is None or len(flare_occurred) == 0:
-            flare_occurred = [0, 1]
+        start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred = normalize_filters(
+            start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred)
     except Exception as e:
         raise PreventUpdate
     
     try:
         # Filter data
-        flare_filtered = solar_flare_df[
-            (solar_flare_df['observation_date'] >= start_date) & 
-            (solar_flare_df['observation_date'] <= end_date) &
-            (solar_flare_df['magnetic_complexity'].isin(magnetic_types)) &
-            (solar_flare_df['sunspot_count'] >= sunspot_range[0]) &
-            (solar_flare_df['sunspot_count'] <= sunspot_range[1]) &
-            (solar_flare_df['flare_occurred'].isin(flare_occurred))
-        ].copy()
+        idx = filtered_indices(*filter_key(start_date, end_date, (), magnetic_types, sunspot_range, flare_occurred))
         
-        if len(flare_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available for selected filters", 
-                                            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        if len(idx) == 0:
+            return _EMPTY_FIG
         
         # Create treemap data
-        magnetic_counts = flare_filtered['magnetic_complexity'].value_counts()
+        magnetic_labels, magnetic_values = category_counts(_FLARE_MAG_CODE[idx], _MAG_NAMES)
         
         # Create interactive treemap
         fig = go.Figure(go.Treemap(
-            labels=magnetic_counts.index,
-            values=magnetic_counts.values,
-            parents=[''] * len(magnetic_counts),
+            labels=magnetic_labels,
+            values=magnetic_values,
+            parents=[''] * len(magnetic_labels),
             marker=dict(
                 colors=['#FF6B35', '#F7931E', '#FF4444', '#4ECDC4'],
                 line=dict(color='white', width=2)
@@ -4178,21 +4174,33 @@ def update_solar_violin_plot(start_date, end_date, flare_classes, magnetic_types
             hovertemplate='<b>%{label}</b><br>Count: %{value}<br><extra></extra>'
         ))
         
-        fig.update_layout(
-            title=dict(text="Activity Treemap", 
-                      font=dict(size=16, color='#2C3E50', family='Inter')),
-            template='none',
-            height=400,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=60, b=50, l=50, r=50)
-        )
+        fig.update_layout(**_LAYOUT_TREEMAP)
         
         return fig
     except Exception as e:
-        print(f"ERROR in update_solar_treemap: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_solar_treemap: %s", e)
+        return _ERROR_FIG
+
+_LAYOUT_RADAR = dict(
+    **_LAYOUT_BASE,
+    title=dict(text="Multi-dimensional Radar", 
+              font=dict(size=16, color='#2C3E50', family='Inter')),
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 1],
+            color='#2C3E50',
+            gridcolor='rgba(255, 107, 53, 0.15)'
+        ),
+        angularaxis=dict(
+            color='#2C3E50',
+            gridcolor='rgba(255, 107, 53, 0.15)'
+        ),
+        bgcolor='rgba(255, 255, 255, 0.1)'
+    ),
+    height=400,
+    margin=dict(t=60, b=50, l=50, r=50)
+)
 
 # Interactive Radar Chart
 @app.callback(
@@ -4206,61 +4214,24 @@ def update_solar_violin_plot(start_date, end_date, flare_classes, magnetic_types
 )
 def update_solar_bubble_chart(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
     try:
-        # Handle None dates
-        if start_date is None:
-            start_date = solar_flare_df['observation_date'].min()
-        if end_date is None:
-            end_date = solar_flare_df['observation_date'].max()
-        
-        # Convert to datetime if strings
-        start_date = pd.to_datetime(start_date)
-        end_date = pd.to_datetime(end_date)
-        
-        # Handle None filters
-        if flare_classes is None or len(flare_classes) == 0:
-            flare_classes = ['X', 'M', 'C']
-        if magnetic_types is None or len(magnetic_types) == 0:
-            magnetic_types = ['Alpha', 'Beta', 'Gamma', 'Delta']
-        if sunspot_range is None or len(sunspot_range) < 2:
-            sunspot_range = [float(solar_flare_df['sunspot_count'].min()), float(solar_flare_df['sunspot_count'].max())]
-        if flare_occurred is None or len(flare_occurred) == 0:
-            flare_occurred = [0, 1]
+        start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred = normalize_filters(
+            start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred)
     except Exception as e:
         raise PreventUpdate
     
     try:
         # Filter data
-        flare_filtered = solar_flare_df[
-            (solar_flare_df['observation_date'] >= start_date) & 
-            (solar_flare_df['observation_date'] <= end_date) &
-            (solar_flare_df['magnetic_complexity'].isin(magnetic_types)) &
-            (solar_flare_df['sunspot_count'] >= sunspot_range[0]) &
-            (solar_flare_df['sunspot_count'] <= sunspot_range[1]) &
-            (solar_flare_df['flare_occurred'].isin(flare_occurred))
-        ].copy()
+        idx = filtered_indices(*filter_key(start_date, end_date, (), magnetic_types, sunspot_range, flare_occurred))
         
-        if len(flare_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available for selected filters", 
-                                            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        if len(idx) == 0:
+            return _EMPTY_FIG
         
         # Create radar chart data
         categories = ['Sunspot Count', 'X-Class Flares', 'M-Class Flares', 'C-Class Flares', 'Flare Index']
-        values = [
-            flare_filtered['sunspot_count'].mean(),
-            flare_filtered['x_class_flares'].mean(),
-            flare_filtered['m_class_flares'].mean(),
-            flare_filtered['c_class_flares'].mean(),
-            flare_filtered['flare_index'].mean()
-        ]
-        
-        # Normalize values for radar chart
-        max_values = [flare_filtered['sunspot_count'].max(), 
-                     flare_filtered['x_class_flares'].max(),
-                     flare_filtered['m_class_flares'].max(),
-                     flare_filtered['c_class_flares'].max(),
-                     flare_filtered['flare_index'].max()]
+        values = _RADAR_VALUES[idx].mean(axis=0)
         
-        normalized_values = [v/max_v if max_v > 0 else 0 for v, max_v in zip(values, max_values)]
+        # Normalize values for radar chart against the dataset-wide maxima
+        normalized_values = np.divide(values, _GLOBAL_MAX, out=np.zeros_like(values), where=_GLOBAL_MAX > 0).tolist()
         
         # Create interactive radar chart
         fig = go.Figure(data=go.Scatterpolar(
@@ -4272,34 +4243,58 @@ def update_solar_bubble_chart(start_date, end_date, flare_classes, magnetic_type
             name='Solar Activity'
         ))
         
-        fig.update_layout(
-            title=dict(text="Multi-dimensional Radar", 
-                      font=dict(size=16, color='#2C3E50', family='Inter')),
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 1],
-                    color='#2C3E50',
-                    gridcolor='rgba(255, 107, 53, 0.15)'
-                ),
-                angularaxis=dict(
-                    color='#2C3E50',
-                    gridcolor='rgba(255, 107, 53, 0.15)'
-                ),
-                bgcolor='rgba(255, 255, 255, 0.1)'
-            ),
-            template='none',
-            height=400,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=60, b=50, l=50, r=50)
-        )
+        fig.update_layout(**_LAYOUT_RADAR)
         
         return fig
     except Exception as e:
-        print(f"ERROR in update_solar_radar_chart: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_solar_radar_chart: %s", e)
+        return _ERROR_FIG
+
+def ohlc_by_bucket(buckets, values):
+    """Per-bucket mean, min and max of values in one pass, keyed by the sorted unique buckets"""
+    keys, inverse = np.unique(buckets, return_inverse=True)
+    counts = np.bincount(inverse, minlength=len(keys))
+    mean = np.bincount(inverse, weights=values, minlength=len(keys)) / counts
+    low = np.full(len(keys), np.inf)
+    high = np.full(len(keys), -np.inf)
+    np.minimum.at(low, inverse, values)
+    np.maximum.at(high, inverse, values)
+    return keys, mean, low, high
+
+@lru_cache(maxsize=64)
+def monthly_ohlc(start_date, end_date, class_key, magnetic_key, sunspot_low, sunspot_high, occurred_key):
+    """Sunspot (open, low, high, close) rows for the first 6 months passing the filters, with their month starts"""
+    idx = filtered_indices(start_date, end_date, class_key, magnetic_key, sunspot_low, sunspot_high, occurred_key)
+    if len(idx) == 0:
+        return np.empty(0, dtype='datetime64[ns]'), np.empty((0, 4))
+    
+    # Aggregate only the rows up to the sixth distinct month
+    months = _FLARE_MONTH[idx]
+    first_months = months <= np.unique(months)[:6][-1]
+    months, sunspot_open, sunspot_low, sunspot_high = ohlc_by_bucket(months[first_months], _FLARE_SUNSPOTS[idx[first_months]])
+    
+    # Using open as close for simplicity
+    return months.astype('datetime64[ns]'), np.column_stack([sunspot_open, sunspot_low, sunspot_high, sunspot_open])
+
+_LAYOUT_CANDLESTICK = dict(
+    **_LAYOUT_BASE,
+    title=dict(text="Activity Candlestick", 
+              font=dict(size=16, color='#2C3E50', family='Inter')),
+    xaxis=dict(
+        title=dict(text="Month", font=dict(size=12, color='#2C3E50', family='Inter')),
+        color='#2C3E50', 
+        gridcolor='rgba(255, 107, 53, 0.15)',
+        tickfont=dict(size=10, color='#2C3E50', family='Inter')
+    ),
+    yaxis=dict(
+        title=dict(text="Sunspot Count", font=dict(size=12, color='#2C3E50', family='Inter')),
+        color='#2C3E50', 
+        gridcolor='rgba(255, 107, 53, 0.15)',
+        tickfont=dict(size=10, color='#2C3E50', family='Inter')
+    ),
+    height=400,
+    margin=dict(t=60, b=50, l=60, r=50)
+)
 
 # Interactive Candlestick Chart
 @app.callback(
@@ -4313,96 +4308,61 @@ def update_solar_bubble_chart(start_date, end_date, flare_classes, magnetic_type
 )
 def update_solar_treemap(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
     try:
-        # Handle None dates
-        if start_date is None:
-            start_date = solar_flare_df['observation_date'].min()
-        if end_date is None:
-            end_date = solar_flare_df['observation_date'].max()
-        
-        # Convert to datetime if strings
-        start_date = pd.to_datetime(start_date)
-        end_date = pd.to_datetime(end_date)
-        
-        # Handle None filters
-        if flare_classes is None or len(flare_classes) == 0:
-            flare_classes = ['X', 'M', 'C']
-        if magnetic_types is None or len(magnetic_types) == 0:
-            magnetic_types = ['Alpha', 'Beta', 'Gamma', 'Delta']
-        if sunspot_range is None or len(sunspot_range) < 2:
-            sunspot_range = [float(solar_flare_df['sunspot_count'].min()), float(solar_flare_df['sunspot_count'].max())]
-        if flare_occurred is None or len(flare_occurred) == 0:
-            flare_occurred = [0, 1]
+        start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred = normalize_filters(
+            start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred)
     except Exception as e:
         raise PreventUpdate
     
     try:
-        # Filter data
-        flare_filtered = solar_flare_df[
-            (solar_flare_df['observation_date'] >= start_date) & 
-            (solar_flare_df['observation_date'] <= end_date) &
-            (solar_flare_df['magnetic_complexity'].isin(magnetic_types)) &
-            (solar_flare_df['sunspot_count'] >= sunspot_range[0]) &
-            (solar_flare_df['sunspot_count'] <= sunspot_range[1]) &
-            (solar_flare_df['flare_occurred'].isin(flare_occurred))
-        ].copy()
-        
-        if len(flare_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available for selected filters", 
-                                            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        
-        # Create monthly candlestick data
-        monthly_data = flare_filtered.groupby(flare_filtered['observation_date'].dt.to_period('M')).agg({
-            'x_class_flares': ['sum', 'min', 'max'],
-            'm_class_flares': ['sum', 'min', 'max'],
-            'c_class_flares': ['sum', 'min', 'max'],
-            'sunspot_count': ['mean', 'min', 'max']
-        }).reset_index()
+        # Monthly candlestick rows, cached per filter combination
+        months, ohlc = monthly_ohlc(*filter_key(start_date, end_date, (), magnetic_types, sunspot_range, flare_occurred))
         
-        monthly_data.columns = ['observation_date', 'x_open', 'x_low', 'x_high', 'm_open', 'm_low', 'm_high', 'c_open', 'c_low', 'c_high', 'sunspot_open', 'sunspot_low', 'sunspot_high']
-        monthly_data['observation_date'] = monthly_data['observation_date'].dt.to_timestamp()
-        
-        # Take first 6 months for candlestick (reduced for performance)
-        candlestick_data = monthly_data.head(6)
+        if len(months) == 0:
+            return _EMPTY_FIG
         
         # Create interactive candlestick chart
         fig = go.Figure(data=go.Candlestick(
-            x=candlestick_data['observation_date'],
-            open=candlestick_data['sunspot_open'],
-            high=candlestick_data['sunspot_high'],
-            low=candlestick_data['sunspot_low'],
-            close=candlestick_data['sunspot_open'],  # Using open as close for simplicity
+            x=months,
+            open=ohlc[:, 0],
+            low=ohlc[:, 1],
+            high=ohlc[:, 2],
+            close=ohlc[:, 3],
             increasing_line_color='#FF6B35',
             decreasing_line_color='#F7931E',
             name='Sunspot Activity'
         ))
         
-        fig.update_layout(
-            title=dict(text="Activity Candlestick", 
-                      font=dict(size=16, color='#2C3E50', family='Inter')),
-            xaxis=dict(
-                title=dict(text="Month", font=dict(size=12, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)',
-                tickfont=dict(size=10, color='#2C3E50', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Sunspot Count", font=dict(size=12, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)',
-                tickfont=dict(size=10, color='#2C3E50', family='Inter')
-            ),
-            template='none',
-            height=400,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=60, b=50, l=60, r=50)
-        )
+        fig.update_layout(**_LAYOUT_CANDLESTICK)
         
         return fig
     except Exception as e:
-        print(f"ERROR in update_solar_candlestick_chart: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_solar_candlestick_chart: %s", e)
+        return _ERROR_FIG
+
+_LAYOUT_ANOMALY = dict(
+    **_LAYOUT_BASE,
+    title=dict(text="Anomaly Detection", 
+              font=dict(size=18, color='#2C3E50', family='Inter')),
+    xaxis=dict(
+        title=dict(text="Date", font=dict(size=14, color='#2C3E50', family='Inter')),
+        color='#2C3E50', 
+        gridcolor='rgba(255, 107, 53, 0.15)',
+        tickfont=dict(size=12, color='#2C3E50', family='Inter')
+    ),
+    yaxis=dict(
+        title=dict(text="Total Flares", font=dict(size=14, color='#2C3E50', family='Inter')),
+        color='#2C3E50', 
+        gridcolor='rgba(255, 107, 53, 0.15)',
+        tickfont=dict(size=12, color='#2C3E50', family='Inter')
+    ),
+    height=500,
+    legend=dict(
+        bgcolor='rgba(255, 255, 255, 0.8)',
+        bordercolor='rgba(255, 107, 53, 0.3)',
+        font=dict(size=12, color='#2C3E50', family='Inter')
+    ),
+    margin=dict(t=80, b=60, l=80, r=80)
+)
 
 # Anomaly Detection
 @app.callback(
@@ -4416,64 +4376,38 @@ def update_solar_treemap(start_date, end_date, flare_classes, magnetic_types, su
 )
 def update_anomaly_detection(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred):
     try:
-        # Handle None dates
-        if start_date is None:
-            start_date = solar_flare_df['observation_date'].min()
-        if end_date is None:
-            end_date = solar_flare_df['observation_date'].max()
-        
-        # Convert to datetime if strings
-        start_date = pd.to_datetime(start_date)
-        end_date = pd.to_datetime(end_date)
-        
-        # Handle None filters
-        if flare_classes is None or len(flare_classes) == 0:
-            flare_classes = ['X', 'M', 'C']
-        if magnetic_types is None or len(magnetic_types) == 0:
-            magnetic_types = ['Alpha', 'Beta', 'Gamma', 'Delta']
-        if sunspot_range is None or len(sunspot_range) < 2:
-            sunspot_range = [float(solar_flare_df['sunspot_count'].min()), float(solar_flare_df['sunspot_count'].max())]
-        if flare_occurred is None or len(flare_occurred) == 0:
-            flare_occurred = [0, 1]
+        start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred = normalize_filters(
+            start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred)
     except Exception as e:
         raise PreventUpdate
     
     try:
         # Filter data
-        flare_filtered = solar_flare_df[
-            (solar_flare_df['observation_date'] >= start_date) & 
-            (solar_flare_df['observation_date'] <= end_date) &
-            (solar_flare_df['magnetic_complexity'].isin(magnetic_types)) &
-            (solar_flare_df['sunspot_count'] >= sunspot_range[0]) &
-            (solar_flare_df['sunspot_count'] <= sunspot_range[1]) &
-            (solar_flare_df['flare_occurred'].isin(flare_occurred))
-        ].copy()
-        
-        if len(flare_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available for selected filters", 
-                                            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        idx = filtered_indices(*filter_key(start_date, end_date, (), magnetic_types, sunspot_range, flare_occurred))
         
-        # Calculate total flares
-        flare_filtered['total_flares'] = flare_filtered['x_class_flares'] + flare_filtered['m_class_flares'] + flare_filtered['c_class_flares']
+        if len(idx) == 0:
+            return _EMPTY_FIG
         
-        # Simple anomaly detection using IQR method
-        Q1 = flare_filtered['total_flares'].quantile(0.25)
-        Q3 = flare_filtered['total_flares'].quantile(0.75)
+        # Simple anomaly detection using IQR method, both quartiles from one partition of the raw array
+        dates = _FLARE_DATES[idx]
+        total_flares = _FLARE_TOTAL[idx]
+        Q1, Q3 = np.quantile(total_flares, [0.25, 0.75])
         IQR = Q3 - Q1
         lower_bound = Q1 - 1.5 * IQR
         upper_bound = Q3 + 1.5 * IQR
         
-        # Identify anomalies
-        flare_filtered['is_anomaly'] = (flare_filtered['total_flares'] < lower_bound) | (flare_filtered['total_flares'] > upper_bound)
+        # Identify anomalies on the raw arrays
+        is_anomaly = np.logical_or(total_flares < lower_bound, total_flares > upper_bound)
+        normal_positions = np.flatnonzero(~is_anomaly)
+        normal_positions = normal_positions[downsample_positions(len(normal_positions), _MAX_NORMAL_POINTS)]
         
         # Create the plot
         fig = go.Figure()
         
         # Normal data points
-        normal_data = flare_filtered[~flare_filtered['is_anomaly']]
         fig.add_trace(go.Scatter(
-            x=normal_data['observation_date'],
-            y=normal_data['total_flares'],
+            x=dates[normal_positions],
+            y=total_flares[normal_positions],
             mode='markers',
             name='Normal',
             marker=dict(color='#2E8B57', size=6),
@@ -4481,11 +4415,10 @@ def update_anomaly_detection(start_date, end_date, flare_classes, magnetic_types
         ))
         
         # Anomaly data points
-        anomaly_data = flare_filtered[flare_filtered['is_anomaly']]
-        if len(anomaly_data) > 0:
+        if is_anomaly.any():
             fig.add_trace(go.Scatter(
-                x=anomaly_data['observation_date'],
-                y=anomaly_data['total_flares'],
+                x=dates[is_anomaly],
+                y=total_flares[is_anomaly],
                 mode='markers',
                 name='Anomaly',
                 marker=dict(color='#FF4444', size=10, symbol='diamond'),
@@ -4498,38 +4431,68 @@ def update_anomaly_detection(start_date, end_date, flare_classes, magnetic_types
         fig.add_hline(y=lower_bound, line_dash="dash", line_color="red", 
                      annotation_text=f"Lower Threshold: {lower_bound:.1f}")
         
-        fig.update_layout(
-            title=dict(text="Anomaly Detection", 
-                      font=dict(size=18, color='#2C3E50', family='Inter')),
-            xaxis=dict(
-                title=dict(text="Date", font=dict(size=14, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)',
-                tickfont=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Total Flares", font=dict(size=14, color='#2C3E50', family='Inter')),
-                color='#2C3E50', 
-                gridcolor='rgba(255, 107, 53, 0.15)',
-                tickfont=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-            template='none',
-            height=500,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            legend=dict(
-                bgcolor='rgba(255, 255, 255, 0.8)',
-                bordercolor='rgba(255, 107, 53, 0.3)',
-                font=dict(size=12, color='#2C3E50', family='Inter')
-            ),
-            margin=dict(t=80, b=60, l=80, r=80)
-        )
+        fig.update_layout(**_LAYOUT_ANOMALY)
         
         return fig
     except Exception as e:
-        print(f"ERROR in update_anomaly_detection: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_anomaly_detection: %s", e)
+        return _ERROR_FIG
+
+@lru_cache(maxsize=16)
+def solar_heatmap_figure(start_date, end_date, class_key, magnetic_key, sunspot_low, sunspot_high, occurred_key):
+    """Build the monthly flare heatmap for one filter combination, memoized on the filter_key tuple"""
+    # Apply filters
+    idx = filtered_indices(start_date, end_date, class_key, magnetic_key, sunspot_low, sunspot_high, occurred_key)
+    
+    if len(idx) == 0:
+        return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False).to_dict()
+    
+    # Aggregate monthly totals into a dense year x month grid in one bincount
+    years = solar_flare_df['year'].to_numpy()[idx]
+    months = solar_flare_df['month'].to_numpy()[idx]
+    heatmap_years, year_idx = np.unique(years, return_inverse=True)
+    heatmap_grid = np.bincount(year_idx * 12 + (months - 1), weights=_FLARE_TOTAL[idx],
+                               minlength=len(heatmap_years) * 12).reshape(len(heatmap_years), 12).astype(np.int64)
+    
+    # Create heatmap
+    fig = go.Figure(data=go.Heatmap(
+        z=heatmap_grid,
+        x=np.arange(1, 13),
+        y=heatmap_years,
+        colorscale=[[0, '#FFF3E0'], [0.3, '#FFB74D'], [0.6, '#FF8A65'], [1, '#FF6B35']],
+        hovertemplate='<b>Year:</b> %{y}<br><b>Month:</b> %{x}<br><b>Total Flares:</b> %{z}<br><extra></extra>',
+        colorbar=dict(
+            title="Total Flares",
+            titlefont=dict(size=12, color='#FF6B35', family='Inter'),
+            tickfont=dict(size=10, color='#FF6B35', family='Inter')
+        )
+    ))
+    
+    fig.update_layout(
+        title=dict(text="Solar Activity Heatmap", 
+                  font=dict(size=18, color='#2C3E50', family='Inter')),
+        xaxis=dict(
+            title=dict(text="Month", font=dict(size=14, color='#FF6B35', family='Inter')),
+            color='#FF6B35',
+            tickmode='linear',
+            tick0=1,
+            dtick=1,
+            tickfont=dict(size=12, color='#FF6B35', family='Inter')
+        ),
+        yaxis=dict(
+            title=dict(text="Year", font=dict(size=14, color='#FF6B35', family='Inter')),
+            color='#FF6B35',
+            tickfont=dict(size=12, color='#FF6B35', family='Inter')
+        ),
+        template='none',
+        height=400,
+        plot_bgcolor='rgba(255, 255, 255, 0.1)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter', color='#2C3E50'),
+        margin=dict(t=80, b=60, l=80, r=80)
+    )
+    
+    return fig.to_dict()
 
 # Callback for Solar Activity Heatmap
 @app.callback(
@@ -4544,66 +4507,71 @@ def update_anomaly_detection(start_date, end_date, flare_classes, magnetic_types
 )
 def update_solar_heatmap(start_date, end_date, flare_classes, cycle_phases, magnetic_types, sunspot_range, flare_occurred):
     try:
-        # Apply filters
-        flare_filtered = apply_filters(solar_flare_df, start_date, end_date, flare_classes, cycle_phases, magnetic_types, sunspot_range, flare_occurred)
-        
-        if len(flare_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        
-        # Create monthly heatmap data
-        flare_filtered['month'] = flare_filtered['observation_date'].dt.month
-        flare_filtered['year'] = flare_filtered['observation_date'].dt.year
-        
-        # Aggregate data for heatmap
-        heatmap_data = flare_filtered.groupby(['year', 'month']).agg({
-            'total_flares': 'sum',
-            'x_class_flares': 'sum',
-            'm_class_flares': 'sum',
-            'c_class_flares': 'sum'
-        }).reset_index()
-        
-        # Create heatmap
-        fig = go.Figure(data=go.Heatmap(
-            z=heatmap_data['total_flares'],
-            x=heatmap_data['month'],
-            y=heatmap_data['year'],
-            colorscale=[[0, '#FFF3E0'], [0.3, '#FFB74D'], [0.6, '#FF8A65'], [1, '#FF6B35']],
-            hovertemplate='<b>Year:</b> %{y}<br><b>Month:</b> %{x}<br><b>Total Flares:</b> %{z}<br><extra></extra>',
-            colorbar=dict(
-                title="Total Flares",
-                titlefont=dict(size=12, color='#FF6B35', family='Inter'),
-                tickfont=dict(size=10, color='#FF6B35', family='Inter')
-            )
-        ))
-        
-        fig.update_layout(
-            title=dict(text="Solar Activity Heatmap", 
-                      font=dict(size=18, color='#2C3E50', family='Inter')),
-            xaxis=dict(
-                title=dict(text="Month", font=dict(size=14, color='#FF6B35', family='Inter')),
-                color='#FF6B35',
-                tickmode='linear',
-                tick0=1,
-                dtick=1,
-                tickfont=dict(size=12, color='#FF6B35', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Year", font=dict(size=14, color='#FF6B35', family='Inter')),
-                color='#FF6B35',
-                tickfont=dict(size=12, color='#FF6B35', family='Inter')
-            ),
-            template='none',
-            height=400,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=60, l=80, r=80)
-        )
-        
-        return fig
+        start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred = normalize_filters(
+            start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred)
+    except Exception as e:
+        raise PreventUpdate
+    
+    try:
+        # The flare records carry no cycle phase, so that filter does not apply here.
+        # The cached figure dict goes to Dash as-is, so a cache hit skips rebuilding the Figure
+        return solar_heatmap_figure(*filter_key(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred))
     except Exception as e:
-        print(f"ERROR in update_solar_heatmap: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_solar_heatmap: %s", e)
+        return _ERROR_FIG
+
+@lru_cache(maxsize=16)
+def flare_intensity_histogram_figure(start_date, end_date, class_key, magnetic_key, sunspot_low, sunspot_high, occurred_key):
+    """Build the flare intensity histogram for one filter combination, memoized on the filter_key tuple"""
+    # Apply filters, gathering only the flare totals the histogram reads
+    total_flares = _FLARE_TOTAL[filtered_indices(start_date, end_date, class_key, magnetic_key, sunspot_low, sunspot_high, occurred_key)]
+    
+    if len(total_flares) == 0:
+        return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False).to_dict()
+    
+    # Create intensity categories
+    intensity_bins = [0, 10, 25, 50, 100, 200, 500, 1000]
+    intensity_labels = ['0-10', '11-25', '26-50', '51-100', '101-200', '201-500', '501-1000']
+    
+    intensity_counts = bin_counts(total_flares, intensity_bins, include_lowest=True)
+    
+    # Beautiful Blue Theme for Histogram
+    fig = go.Figure(data=[go.Bar(
+        x=intensity_labels,
+        y=intensity_counts,
+        marker=dict(
+            color=['#3498DB', '#5DADE2', '#85C1E9', '#AED6F1', '#D6EAF8', '#EBF5FB', '#F8F9FA'],
+            line=dict(color='white', width=2)
+        ),
+        hovertemplate='<b>Intensity Range:</b> %{x}<br><b>Count:</b> %{y}<br><extra></extra>',
+        text=intensity_counts,
+        textposition='auto',
+        textfont=dict(size=12, color='white', family='Inter')
+    )])
+    
+    fig.update_layout(
+        title=dict(text="Flare Intensity Distribution", 
+                  font=dict(size=18, color='#2C3E50', family='Inter')),
+        xaxis=dict(
+            title=dict(text="Flare Intensity Range", font=dict(size=14, color='#3498DB', family='Inter')),
+            color='#3498DB',
+            tickfont=dict(size=12, color='#3498DB', family='Inter')
+        ),
+        yaxis=dict(
+            title=dict(text="Count", font=dict(size=14, color='#3498DB', family='Inter')),
+            color='#3498DB',
+            gridcolor='rgba(52, 152, 219, 0.2)',
+            tickfont=dict(size=12, color='#3498DB', family='Inter')
+        ),
+        template='none',
+        height=400,
+        plot_bgcolor='rgba(255, 255, 255, 0.1)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter', color='#2C3E50'),
+        margin=dict(t=80, b=60, l=80, r=80)
+    )
+    
+    return fig.to_dict()
 
 # Callback for Flare Intensity Histogram
 @app.callback(
@@ -4618,380 +4586,277 @@ def update_solar_heatmap(start_date, end_date, flare_classes, cycle_phases, magn
 )
 def update_flare_intensity_histogram(start_date, end_date, flare_classes, cycle_phases, magnetic_types, sunspot_range, flare_occurred):
     try:
-        # Apply filters
-        flare_filtered = apply_filters(solar_flare_df, start_date, end_date, flare_classes, cycle_phases, magnetic_types, sunspot_range, flare_occurred)
-        
-        if len(flare_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        
-        # Create intensity categories
-        intensity_bins = [0, 10, 25, 50, 100, 200, 500, 1000]
-        intensity_labels = ['0-10', '11-25', '26-50', '51-100', '101-200', '201-500', '501-1000']
-        
-        flare_filtered['intensity_bin'] = pd.cut(flare_filtered['total_flares'], bins=intensity_bins, labels=intensity_labels, include_lowest=True)
-        intensity_counts = flare_filtered['intensity_bin'].value_counts().sort_index()
-        
-        # Beautiful Blue Theme for Histogram
-        fig = go.Figure(data=[go.Bar(
-            x=intensity_counts.index,
-            y=intensity_counts.values,
-            marker=dict(
-                color=['#3498DB', '#5DADE2', '#85C1E9', '#AED6F1', '#D6EAF8', '#EBF5FB', '#F8F9FA'],
-                line=dict(color='white', width=2)
-            ),
-            hovertemplate='<b>Intensity Range:</b> %{x}<br><b>Count:</b> %{y}<br><extra></extra>',
-            text=intensity_counts.values,
-            textposition='auto',
-            textfont=dict(size=12, color='white', family='Inter')
-        )])
-        
-        fig.update_layout(
-            title=dict(text="Flare Intensity Distribution", 
-                      font=dict(size=18, color='#2C3E50', family='Inter')),
-            xaxis=dict(
-                title=dict(text="Flare Intensity Range", font=dict(size=14, color='#3498DB', family='Inter')),
-                color='#3498DB',
-                tickfont=dict(size=12, color='#3498DB', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Count", font=dict(size=14, color='#3498DB', family='Inter')),
-                color='#3498DB',
-                gridcolor='rgba(52, 152, 219, 0.2)',
-                tickfont=dict(size=12, color='#3498DB', family='Inter')
-            ),
-            template='none',
-            height=400,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=60, l=80, r=80)
-        )
-        
-        return fig
+        start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred = normalize_filters(
+            start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred)
     except Exception as e:
-        print(f"ERROR in update_flare_intensity_histogram: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-
-# Callback for Solar Activity Area Chart
-@app.callback(
-    Output('solar-activity-area', 'figure'),
-    [Input('start-date-picker', 'date'),
-     Input('end-date-picker', 'date'),
-     Input('flare-class-filter', 'value'),
-     Input('cycle-phase-filter', 'value'),
-     Input('magnetic-complexity-filter', 'value'),
-     Input('sunspot-count-slider', 'value'),
-     Input('flare-occurred-filter', 'value')]
-)
-def update_solar_activity_area(start_date, end_date, flare_classes, cycle_phases, magnetic_types, sunspot_range, flare_occurred):
+        raise PreventUpdate
+    
     try:
-        # Apply filters to sunspot data
-        sunspot_filtered = sunspot_df[
-            (sunspot_df['date'] >= start_date) & 
-            (sunspot_df['date'] <= end_date)
-        ].copy()
-        
-        if len(sunspot_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        
-        # Create solar wind data from sunspot data using existing columns
-        wind_pressure_data = sunspot_filtered.groupby(sunspot_filtered['date'].dt.to_period('M')).agg({
-            'avg_solar_wind_speed': 'mean',
-            'geomagnetic_index': 'mean',
-            'temperature_variation': 'mean'
-        }).reset_index()
-        
-        wind_pressure_data['date'] = wind_pressure_data['date'].dt.to_timestamp()
-        
-        # Beautiful Orange Theme for Solar Activity Categories - Pie Chart
-        # Create activity categories based on solar wind speed
-        wind_pressure_data['activity_category'] = pd.cut(
-            wind_pressure_data['avg_solar_wind_speed'], 
-            bins=[0, 300, 400, 500, float('inf')], 
-            labels=['Low Activity', 'Medium Activity', 'High Activity', 'Very High Activity']
-        )
-        
-        # Count categories
-        category_counts = wind_pressure_data['activity_category'].value_counts()
-        
-        # Sunrise Orange Theme for Activity Categories
-        color_map = {
-            'Low Activity': '#FFD700',      # Gold
-            'Medium Activity': '#FFB347',   # Peach
-            'High Activity': '#FFA500',     # Orange
-            'Very High Activity': '#FF8C00' # Dark Orange
-        }
-        colors_list = [color_map.get(label, '#FF6B35') for label in category_counts.index]
-        
-        # Create pie chart
-        fig = go.Figure(data=[go.Pie(
-            labels=category_counts.index,
-            values=category_counts.values,
-            marker_colors=colors_list,
-            textinfo='label+value+percent',
-            textfont_size=14,
-            textfont_color='white',
-            textfont_family='Inter',
-            hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<br><extra></extra>',
-            marker_line=dict(color='white', width=2),
-            rotation=0,
-            pull=[0.1, 0.05, 0.05, 0.05],
-            textposition='inside'
-        )])
-        
-        fig.update_layout(
-            template='none',
-            height=400,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=60, l=60, r=60),
-            hovermode='x unified'
-        )
-        
-        return fig
+        # The flare records carry no cycle phase, so that filter does not apply here.
+        # The cached figure dict goes to Dash as-is, so a cache hit skips rebuilding the Figure
+        return flare_intensity_histogram_figure(*filter_key(start_date, end_date, flare_classes, magnetic_types, sunspot_range, flare_occurred))
     except Exception as e:
-        print(f"ERROR in update_solar_activity_area: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        app.logger.warning("ERROR in update_flare_intensity_histogram: %s", e)
+        return _ERROR_FIG
 
-# Callback for Flare Intensity Bar Chart
-@app.callback(
-    Output('flare-intensity-bar', 'figure'),
-    [Input('start-date-picker', 'date'),
-     Input('end-date-picker', 'date'),
-     Input('flare-class-filter', 'value'),
-     Input('cycle-phase-filter', 'value'),
-     Input('magnetic-complexity-filter', 'value'),
-     Input('sunspot-count-slider', 'value'),
-     Input('flare-occurred-filter', 'value')]
-)
-def update_flare_intensity_bar(start_date, end_date, flare_classes, cycle_phases, magnetic_types, sunspot_range, flare_occurred):
-    try:
-        # Apply filters to sunspot data
-        sunspot_filtered = sunspot_df[
-            (sunspot_df['date'] >= start_date) & 
-            (sunspot_df['date'] <= end_date)
-        ].copy()
-        
-        if len(sunspot_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        
-        # Create solar flux data for box plot
-        flux_data = sunspot_filtered.groupby(sunspot_filtered['date'].dt.to_period('M')).agg({
-            'solar_flux': 'mean',
-            'total_sunspots': 'mean'
-        }).reset_index()
-        
-        # Create solar flux bins for box plot
-        flux_bins = pd.cut(flux_data['solar_flux'], bins=5, labels=['Very Low', 'Low', 'Medium', 'High', 'Very High'])
-        flux_data['flux_level'] = flux_bins
-        
-        # Beautiful Orange Theme for Solar Flux Box Plot
-        fig = go.Figure()
-        
-        for level in ['Very Low', 'Low', 'Medium', 'High', 'Very High']:
-            level_data = flux_data[flux_data['flux_level'] == level]['solar_flux'].dropna()
-            if len(level_data) > 0:
-                fig.add_trace(go.Box(
-                    y=level_data,
-                    name=level,
-                    marker_color='#FF6B35',
-                    marker_line=dict(color='white', width=2),
-                    boxpoints='outliers',
-                    hovertemplate=f'<b>{level}</b><br>Solar Flux: %{{y}}<br>Count: %{{customdata}}<extra></extra>',
-                    customdata=[len(level_data)] * len(level_data)
-                ))
-        
-        fig.update_layout(
-            xaxis=dict(
-                title=dict(text="Solar Flux Level", font=dict(size=14, color='#FF6B35', family='Inter')),
-                color='#FF6B35',
-                gridcolor='rgba(255, 107, 53, 0.2)',
-                tickfont=dict(size=12, color='#FF6B35', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Solar Flux Value", font=dict(size=14, color='#FF6B35', family='Inter')),
-                color='#FF6B35',
-                gridcolor='rgba(255, 107, 53, 0.2)',
-                tickfont=dict(size=12, color='#FF6B35', family='Inter')
-            ),
-            template='none',
-            height=400,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=60, l=60, r=60)
-        )
-        
-        return fig
-    except Exception as e:
-        print(f"ERROR in update_flare_intensity_bar: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+_ACTIVITY_LABELS = np.array(['Low Activity', 'Medium Activity', 'High Activity', 'Very High Activity'])
 
-# Callback for Solar Wind Speed Analysis
-@app.callback(
-    Output('solar-wind-chart', 'figure'),
-    [Input('start-date-picker', 'date'),
-     Input('end-date-picker', 'date'),
-     Input('flare-class-filter', 'value'),
-     Input('cycle-phase-filter', 'value'),
-     Input('magnetic-complexity-filter', 'value'),
-     Input('sunspot-count-slider', 'value'),
-     Input('flare-occurred-filter', 'value')]
-)
-def update_solar_wind_chart(start_date, end_date, flare_classes, cycle_phases, magnetic_types, sunspot_range, flare_occurred):
-    try:
-        # Apply filters to sunspot data
-        sunspot_filtered = sunspot_df[
-            (sunspot_df['date'] >= start_date) & 
-            (sunspot_df['date'] <= end_date)
-        ].copy()
-        
-        if len(sunspot_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        
-        # Create geomagnetic index data from sunspot data
-        geomagnetic_data = sunspot_filtered.groupby(sunspot_filtered['date'].dt.to_period('M')).agg({
-            'geomagnetic_index': 'mean',
-            'total_sunspots': 'mean',
-            'solar_flux': 'mean'
-        }).reset_index()
-        
-        geomagnetic_data['date'] = geomagnetic_data['date'].dt.to_timestamp()
-        
-        # Beautiful Orange Theme for Geomagnetic Index - Enhanced Box Plot
-        # Prepare data for better year comparison
-        geomagnetic_data_sorted = geomagnetic_data.sort_values('date')
-        geomagnetic_data_sorted['year'] = geomagnetic_data_sorted['date'].dt.year
-        
-        # Group by year for better comparison
-        years = sorted(geomagnetic_data_sorted['year'].unique())
-        
-        fig = go.Figure()
-        
-        # Create distinct colors for each year - Sunrise Orange Theme
-        colors = ['#FF4500', '#FF8C00', '#FFA500', '#FFB347', '#FFD700', '#FFF8DC']
-        
-        for i, year in enumerate(years):
-            year_data = geomagnetic_data_sorted[geomagnetic_data_sorted['year'] == year]['geomagnetic_index']
-            if len(year_data) > 0:
-                fig.add_trace(go.Box(
-                    y=year_data,
-                    name=str(year),
-                    boxpoints='outliers',
-                    jitter=0.3,
-                    pointpos=-1.8,
-                    fillcolor=colors[i % len(colors)],
-                    line_color='#FF6B35',
-                    marker=dict(
-                        color='#FF6B35',
-                        line=dict(color='white', width=1),
-                        size=8
-                    ),
-                    hovertemplate=f'<b>Year: {year}</b><br>Geomagnetic Index: %{{y:.2f}}<br>Count: {len(year_data)}<extra></extra>'
-                ))
-        
-        fig.update_layout(
-            xaxis=dict(
-                title=dict(text="Year", font=dict(size=14, color='#FF6B35', family='Inter')),
-                color='#FF6B35',
-                gridcolor='rgba(255, 107, 53, 0.2)',
-                tickfont=dict(size=12, color='#FF6B35', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Geomagnetic Index", font=dict(size=14, color='#FF6B35', family='Inter')),
-                color='#FF6B35',
-                gridcolor='rgba(255, 107, 53, 0.2)',
-                tickfont=dict(size=12, color='#FF6B35', family='Inter')
-            ),
-            template='none',
-            height=400,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=60, l=60, r=60)
-        )
-        
-        return fig
-    except Exception as e:
-        print(f"ERROR in update_solar_wind_chart: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+@lru_cache(maxsize=16)
+def solar_activity_area_figure(start_date, end_date):
+    """Build the solar activity category pie, memoized on the date range"""
+    # Monthly solar wind data from the shared sunspot rollup
+    wind_pressure_data = get_monthly_agg(start_date, end_date)
+    
+    if len(wind_pressure_data) == 0:
+        return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False).to_dict()
+    
+    # Beautiful Orange Theme for Solar Activity Categories - Pie Chart
+    # Classify solar wind speed into activity categories: speeds in (0, 300] are Low, then (300, 400], (400, 500], above 500
+    wind_speed = wind_pressure_data['avg_solar_wind_speed'].to_numpy(dtype=float)
+    wind_speed = wind_speed[wind_speed > 0]
+    activity_counts = np.bincount(np.digitize(wind_speed, [300, 400, 500], right=True), minlength=4)
+    
+    # Most frequent first, keeping empty categories like value_counts on the binned speeds
+    order = most_frequent_first(activity_counts)
+    activity_labels, activity_counts = _ACTIVITY_LABELS[order], activity_counts[order]
+    
+    # Sunrise Orange Theme for Activity Categories
+    color_map = {
+        'Low Activity': '#FFD700',      # Gold
+        'Medium Activity': '#FFB347',   # Peach
+        'High Activity': '#FFA500',     # Orange
+        'Very High Activity': '#FF8C00' # Dark Orange
+    }
+    colors_list = [color_map.get(label, '#FF6B35') for label in activity_labels]
+    
+    # Create pie chart
+    fig = go.Figure(data=[go.Pie(
+        labels=activity_labels,
+        values=activity_counts,
+        marker_colors=colors_list,
+        textinfo='label+value+percent',
+        textfont_size=14,
+        textfont_color='white',
+        textfont_family='Inter',
+        hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<br><extra></extra>',
+        marker_line=dict(color='white', width=2),
+        rotation=0,
+        pull=[0.1, 0.05, 0.05, 0.05],
+        textposition='inside'
+    )])
+    
+    fig.update_layout(
+        template='none',
+        height=400,
+        plot_bgcolor='rgba(255, 255, 255, 0.1)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter', color='#2C3E50'),
+        margin=dict(t=80, b=60, l=60, r=60),
+        hovermode='x unified'
+    )
+    
+    return fig.to_dict()
+
+@lru_cache(maxsize=16)
+def flare_intensity_bar_figure(start_date, end_date):
+    """Build the solar flux level box plot, memoized on the date range"""
+    # Monthly solar flux data for box plot from the shared sunspot rollup
+    flux_data = get_monthly_agg(start_date, end_date)
+    
+    if len(flux_data) == 0:
+        return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False).to_dict()
+    
+    # Create solar flux bins for box plot
+    # Five equal-width bins over the flux range, like pd.cut(bins=5); the minimum falls in the first bin
+    flux = flux_data['solar_flux'].to_numpy(dtype=float)
+    flux_edges = np.histogram_bin_edges(flux[~np.isnan(flux)], bins=5)
+    flux_bins = bin_index(flux, flux_edges, include_lowest=True)
+    
+    # Beautiful Orange Theme for Solar Flux Box Plot
+    fig = go.Figure()
+    
+    level_groups = group_arrays(flux_bins, flux)
+    for i, level in enumerate(['Very Low', 'Low', 'Medium', 'High', 'Very High']):
+        level_data = level_groups.get(i, ())
+        if len(level_data) > 0:
+            fig.add_trace(go.Box(
+                y=level_data,
+                name=level,
+                marker_color='#FF6B35',
+                marker_line=dict(color='white', width=2),
+                boxpoints='outliers',
+                hovertemplate=f'<b>{level}</b><br>Solar Flux: %{{y}}<br>Count: %{{meta[0]}}<extra></extra>',
+                meta=[len(level_data)]
+            ))
+    
+    fig.update_layout(
+        xaxis=dict(
+            title=dict(text="Solar Flux Level", font=dict(size=14, color='#FF6B35', family='Inter')),
+            color='#FF6B35',
+            gridcolor='rgba(255, 107, 53, 0.2)',
+            tickfont=dict(size=12, color='#FF6B35', family='Inter')
+        ),
+        yaxis=dict(
+            title=dict(text="Solar Flux Value", font=dict(size=14, color='#FF6B35', family='Inter')),
+            color='#FF6B35',
+            gridcolor='rgba(255, 107, 53, 0.2)',
+            tickfont=dict(size=12, color='#FF6B35', family='Inter')
+        ),
+        template='none',
+        height=400,
+        plot_bgcolor='rgba(255, 255, 255, 0.1)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter', color='#2C3E50'),
+        margin=dict(t=80, b=60, l=60, r=60)
+    )
+    
+    return fig.to_dict()
+
+@lru_cache(maxsize=16)
+def solar_wind_chart_figure(start_date, end_date):
+    """Build the geomagnetic index box plot, memoized on the date range"""
+    # Monthly geomagnetic index data from the shared sunspot rollup
+    geomagnetic_data = get_monthly_agg(start_date, end_date)
+    
+    if len(geomagnetic_data) == 0:
+        return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False).to_dict()
+    
+    # Beautiful Orange Theme for Geomagnetic Index - Enhanced Box Plot
+    # Group by year for better comparison, in one pass over the rows
+    year_of = geomagnetic_data['date'].values.astype('datetime64[Y]').astype(np.int64) + 1970
+    year_groups = group_arrays(year_of, geomagnetic_data['geomagnetic_index'])
+    
+    fig = go.Figure()
+    
+    # Create distinct colors for each year - Sunrise Orange Theme
+    colors = ['#FF4500', '#FF8C00', '#FFA500', '#FFB347', '#FFD700', '#FFF8DC']
+    
+    for i, (year, year_data) in enumerate(year_groups.items()):
+        if len(year_data) > 0:
+            fig.add_trace(go.Box(
+                y=year_data,
+                name=str(year),
+                boxpoints='outliers',
+                jitter=0.3,
+                pointpos=-1.8,
+                fillcolor=colors[i % len(colors)],
+                line_color='#FF6B35',
+                marker=dict(
+                    color='#FF6B35',
+                    line=dict(color='white', width=1),
+                    size=8
+                ),
+                hovertemplate=f'<b>Year: {year}</b><br>Geomagnetic Index: %{{y:.2f}}<br>Count: {len(year_data)}<extra></extra>'
+            ))
+    
+    fig.update_layout(
+        xaxis=dict(
+            title=dict(text="Year", font=dict(size=14, color='#FF6B35', family='Inter')),
+            color='#FF6B35',
+            gridcolor='rgba(255, 107, 53, 0.2)',
+            tickfont=dict(size=12, color='#FF6B35', family='Inter')
+        ),
+        yaxis=dict(
+            title=dict(text="Geomagnetic Index", font=dict(size=14, color='#FF6B35', family='Inter')),
+            color='#FF6B35',
+            gridcolor='rgba(255, 107, 53, 0.2)',
+            tickfont=dict(size=12, color='#FF6B35', family='Inter')
+        ),
+        template='none',
+        height=400,
+        plot_bgcolor='rgba(255, 255, 255, 0.1)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter', color='#2C3E50'),
+        margin=dict(t=80, b=60, l=60, r=60)
+    )
+    
+    return fig.to_dict()
+
+@lru_cache(maxsize=16)
+def flare_energy_chart_figure(start_date, end_date):
+    """Build the temperature variation bar chart, memoized on the date range"""
+    # Monthly temperature variation data from the shared sunspot rollup
+    temp_data = get_monthly_agg(start_date, end_date)
+    
+    if len(temp_data) == 0:
+        return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False).to_dict()
+    
+    # Average the monthly values per year for the vertical bar chart
+    years, yearly_temp = yearly_mean(temp_data['date'].values, temp_data['temperature_variation'])
+    
+    # Beautiful Orange Theme for Temperature Chart - Vertical Bar Chart
+    fig = go.Figure(data=[go.Bar(
+        x=years,
+        y=yearly_temp,
+        name='Temperature Variation',
+        marker_color='#FF6B35',
+        marker_line=dict(color='white', width=2),
+        hovertemplate='<b>Year:</b> %{x}<br><b>Temperature Variation:</b> %{y:.2f}<extra></extra>'
+    )])
+    
+    fig.update_layout(
+        xaxis=dict(
+            title=dict(text="Year", font=dict(size=14, color='#FF6B35', family='Inter')),
+            color='#FF6B35',
+            gridcolor='rgba(255, 107, 53, 0.2)',
+            tickfont=dict(size=12, color='#FF6B35', family='Inter')
+        ),
+        yaxis=dict(
+            title=dict(text="Temperature Variation", font=dict(size=14, color='#FF6B35', family='Inter')),
+            color='#FF6B35',
+            gridcolor='rgba(255, 107, 53, 0.2)',
+            tickfont=dict(size=12, color='#FF6B35', family='Inter')
+        ),
+        template='none',
+        height=400,
+        plot_bgcolor='rgba(255, 255, 255, 0.1)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family='Inter', color='#2C3E50'),
+        margin=dict(t=80, b=60, l=60, r=60)
+    )
+    
+    return fig.to_dict()
+
+# Callback for the sunspot charts that only read the date range
+_SUNSPOT_CHART_BUILDERS = [
+    solar_wind_speed_figure,
+    solar_irradiance_figure,
+    solar_activity_area_figure,
+    flare_intensity_bar_figure,
+    solar_wind_chart_figure,
+    flare_energy_chart_figure,
+]
 
-# Callback for Flare Energy Distribution
 @app.callback(
-    Output('flare-energy-chart', 'figure'),
+    [Output('solar-wind-speed-chart', 'figure'),
+     Output('solar-irradiance-chart', 'figure'),
+     Output('solar-activity-area', 'figure'),
+     Output('flare-intensity-bar', 'figure'),
+     Output('solar-wind-chart', 'figure'),
+     Output('flare-energy-chart', 'figure'),
+     Output('sunspot-charts-key', 'data')],
     [Input('start-date-picker', 'date'),
      Input('end-date-picker', 'date'),
      Input('flare-class-filter', 'value'),
      Input('cycle-phase-filter', 'value'),
      Input('magnetic-complexity-filter', 'value'),
      Input('sunspot-count-slider', 'value'),
-     Input('flare-occurred-filter', 'value')]
+     Input('flare-occurred-filter', 'value')],
+    [State('sunspot-charts-key', 'data')]
 )
-def update_flare_energy_chart(start_date, end_date, flare_classes, cycle_phases, magnetic_types, sunspot_range, flare_occurred):
-    try:
-        # Apply filters to sunspot data
-        sunspot_filtered = sunspot_df[
-            (sunspot_df['date'] >= start_date) & 
-            (sunspot_df['date'] <= end_date)
-        ].copy()
-        
-        if len(sunspot_filtered) == 0:
-            return go.Figure().add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        
-        # Create temperature variation data from sunspot data
-        temp_data = sunspot_filtered.groupby(sunspot_filtered['date'].dt.to_period('M')).agg({
-            'temperature_variation': 'mean',
-            'total_sunspots': 'mean'
-        }).reset_index()
-        
-        temp_data['date'] = temp_data['date'].dt.to_timestamp()
-        
-        # Create temperature variation vertical bar chart over time
-        temp_data_sorted = temp_data.sort_values('date')
-        
-        # Prepare data for vertical bar chart
-        temp_data_sorted['year'] = temp_data_sorted['date'].dt.year
-        temp_data_sorted['month'] = temp_data_sorted['date'].dt.month
-        
-        # Group by year for vertical bar chart
-        yearly_temp = temp_data_sorted.groupby('year')['temperature_variation'].mean().reset_index()
-        
-        # Beautiful Orange Theme for Temperature Chart - Vertical Bar Chart
-        fig = go.Figure(data=[go.Bar(
-            x=yearly_temp['year'],
-            y=yearly_temp['temperature_variation'],
-            name='Temperature Variation',
-            marker_color='#FF6B35',
-            marker_line=dict(color='white', width=2),
-            hovertemplate='<b>Year:</b> %{x}<br><b>Temperature Variation:</b> %{y:.2f}<extra></extra>'
-        )])
-        
-        fig.update_layout(
-            xaxis=dict(
-                title=dict(text="Year", font=dict(size=14, color='#FF6B35', family='Inter')),
-                color='#FF6B35',
-                gridcolor='rgba(255, 107, 53, 0.2)',
-                tickfont=dict(size=12, color='#FF6B35', family='Inter')
-            ),
-            yaxis=dict(
-                title=dict(text="Temperature Variation", font=dict(size=14, color='#FF6B35', family='Inter')),
-                color='#FF6B35',
-                gridcolor='rgba(255, 107, 53, 0.2)',
-                tickfont=dict(size=12, color='#FF6B35', family='Inter')
-            ),
-            template='none',
-            height=400,
-            plot_bgcolor='rgba(255, 255, 255, 0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(family='Inter', color='#2C3E50'),
-            margin=dict(t=80, b=60, l=60, r=60)
-        )
-        
-        return fig
-    except Exception as e:
-        print(f"ERROR in update_flare_energy_chart: {str(e)}")
-        return go.Figure().add_annotation(text=f"Error: {str(e)}", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+@skip_unchanged(lambda start_date, end_date, *filters: [start_date, end_date])
+def update_sunspot_charts(start_date, end_date, flare_classes, cycle_phases, magnetic_types, sunspot_range, flare_occurred):
+    """Build the six date-range sunspot charts in one callback.
+    Only the dates reach the builders, so changes to the other filters are skipped by skip_unchanged"""
+    figures = []
+    for builder in _SUNSPOT_CHART_BUILDERS:
+        try:
+            # Cached figure dicts go to Dash as-is, so a cache hit skips rebuilding the Figure
+            figures.append(builder(start_date, end_date))
+        except Exception as e:
+            app.logger.warning("ERROR in %s: %s", builder.__name__, e)
+            figures.append(_ERROR_FIG)
+    return tuple(figures)
 
 
 if __name__ == '__main__':